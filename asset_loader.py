@@ -1,6 +1,12 @@
 import pygame
 import os
-from typing import Dict, Optional, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional, List, Tuple
+
+try:
+    from PIL import Image, ImageSequence
+except ImportError:  # Pillow is optional; GIFs then load as a single frame
+    Image = None
 
 class AssetLoader:
     """Centralized asset loading and management system"""
@@ -8,54 +14,89 @@ class AssetLoader:
     def __init__(self):
         self.images: Dict[str, pygame.Surface] = {}
         self.animations: Dict[str, List[pygame.Surface]] = {}
+        self.frame_durations: Dict[str, List[int]] = {}
         self.loaded = False
         
-    def load_images(self, base_path: str = "assets/images"):
-        """Load all images from the assets directory"""
+    def load_images(self, base_path: str = "assets/images", target_sizes: Optional[List[Tuple[int, int]]] = None):
+        """Load all images from the assets directory
+
+        Every image is also pre-scaled to each of target_sizes so callers can
+        fetch it with get_image(name, size) without scaling at runtime.
+        """
         if self.loaded:
             return
             
         # Load enemy images
         enemy_path = os.path.join(base_path, "enemies")
         if os.path.exists(enemy_path):
-            for filename in os.listdir(enemy_path):
-                if filename.lower().endswith(('.png', '.jpg', '.jpeg', '.bmp', '.gif')):
-                    name = os.path.splitext(filename)[0].lower()
-                    try:
-                        image_path = os.path.join(enemy_path, filename)
-                        
-                        # Handle GIF animations
-                        if filename.lower().endswith('.gif'):
-                            # Try to load as animated GIF
-                            frames = self.load_gif_frames(image_path)
-                            if len(frames) > 1:
-                                # It's an animated GIF
-                                self.animations[name] = frames
-                                # Use first frame as default image
-                                self.images[name] = frames[0]
-                                print(f"Loaded animated GIF: {name} ({len(frames)} frames)")
-                            else:
-                                # Single frame GIF
-                                self.images[name] = frames[0]
-                                print(f"Loaded GIF image: {name}")
+            filenames = [f for f in os.listdir(enemy_path)
+                         if f.lower().endswith(('.png', '.jpg', '.jpeg', '.bmp', '.gif'))]
+            
+            # Decode files in parallel; display format conversion has to stay on this thread
+            with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+                jobs = {filename: executor.submit(self.decode_frames, os.path.join(enemy_path, filename))
+                        for filename in filenames}
+            
+            for filename, job in jobs.items():
+                name = os.path.splitext(filename)[0].lower()
+                try:
+                    image_path = os.path.join(enemy_path, filename)
+                    
+                    # Handle GIF animations
+                    if filename.lower().endswith('.gif'):
+                        # Try to load as animated GIF
+                        frames = self.load_gif_frames(image_path, job)
+                        if len(frames) > 1:
+                            # It's an animated GIF
+                            self.animations[name] = frames
+                            # Use first frame as default image
+                            self.images[name] = frames[0]
+                            print(f"Loaded animated GIF: {name} ({len(frames)} frames)")
                         else:
-                            # Regular image
-                            image = pygame.image.load(image_path).convert_alpha()
-                            self.images[name] = image
-                            print(f"Loaded enemy image: {name}")
-                    except Exception as e:
-                        print(f"Failed to load {filename}: {e}")
+                            # Single frame GIF
+                            self.images[name] = frames[0]
+                            print(f"Loaded GIF image: {name}")
+                    else:
+                        # Regular image
+                        frames, _ = job.result()
+                        image = frames[0].convert_alpha()
+                        self.images[name] = image
+                        print(f"Loaded enemy image: {name}")
+                except Exception as e:
+                    print(f"Failed to load {filename}: {e}")
+        
+        # Pre-scale every image to the requested sizes
+        for name in list(self.images):
+            for size in target_sizes or ():
+                self.get_image(name, size)
         
         self.loaded = True
     
-    def load_gif_frames(self, gif_path: str) -> List[pygame.Surface]:
-        """Load all frames from a GIF file"""
+    def decode_frames(self, image_path: str) -> Tuple[List[pygame.Surface], List[int]]:
+        """Decode all frames of an image file without display conversion (thread safe)
+
+        Returns the frames and their durations in milliseconds.
+        """
+        if Image is None or not image_path.lower().endswith('.gif'):
+            return [pygame.image.load(image_path)], [0]
+        
+        frames = []
+        durations = []
+        with Image.open(image_path) as gif:
+            for frame in ImageSequence.Iterator(gif):
+                rgba = frame.convert("RGBA")
+                frames.append(pygame.image.fromstring(rgba.tobytes(), rgba.size, "RGBA"))
+                durations.append(frame.info.get("duration", 100))
+        return frames, durations
+    
+    def load_gif_frames(self, gif_path: str, job=None) -> List[pygame.Surface]:
+        """Load all frames from a GIF file, optionally from an already submitted decode job"""
         frames = []
         try:
-            # For now, we'll load GIF as a single image
-            # Full GIF animation support would require additional libraries
-            gif_surface = pygame.image.load(gif_path).convert_alpha()
-            frames.append(gif_surface)
+            decoded, durations = job.result() if job is not None else self.decode_frames(gif_path)
+            frames = [frame.convert_alpha() for frame in decoded]
+            name = os.path.splitext(os.path.basename(gif_path))[0].lower()
+            self.frame_durations[name] = durations
         except Exception as e:
             print(f"Error loading GIF {gif_path}: {e}")
             # Create a placeholder surface
@@ -65,9 +106,23 @@ class AssetLoader:
         
         return frames
     
-    def get_image(self, name: str) -> Optional[pygame.Surface]:
-        """Get a loaded image by name"""
-        return self.images.get(name)
+    def get_image(self, name: str, size: Optional[Tuple[int, int]] = None) -> Optional[pygame.Surface]:
+        """Get a loaded image by name, optionally scaled to size
+
+        Scaled variants are stored as "name@WxH" the first time they are requested.
+        """
+        if size is None:
+            return self.images.get(name)
+        
+        key = f"{name}@{size[0]}x{size[1]}"
+        image = self.images.get(key)
+        if image is None:
+            source = self.images.get(name)
+            if source is None:
+                return None
+            image = pygame.transform.scale(source, size)
+            self.images[key] = image
+        return image
     
     def has_image(self, name: str) -> bool:
         """Check if an image is loaded"""
@@ -1,20 +1,136 @@
-import pygame
+import numpy as np
+from collections import defaultdict
+
+class SpatialHash:
+    """Uniform grid that buckets sprites by the cells their rects overlap"""
+    def __init__(self, cell_size=64):
+        self.cell_size = cell_size
+        self.cells = defaultdict(list)
+
+    @classmethod
+    def from_sprites(cls, sprites, cell_size=64):
+        """Build a grid containing every sprite in an iterable"""
+        grid = cls(cell_size)
+        for sprite in sprites:
+            grid.insert(sprite)
+        return grid
+
+    def _cell_range(self, rect):
+        """Get the inclusive cell bounds covered by a rect"""
+        cs = self.cell_size
+        return rect.left // cs, rect.top // cs, (rect.right - 1) // cs, (rect.bottom - 1) // cs
+
+    def insert(self, sprite):
+        """Add a sprite to every cell its rect overlaps"""
+        x0, y0, x1, y1 = self._cell_range(sprite.rect)
+        cells = self.cells
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                cells[(cx, cy)].append(sprite)
+
+    def query(self, rect):
+        """Get sprites sharing a cell with rect (broad phase only, no overlap test)"""
+        x0, y0, x1, y1 = self._cell_range(rect)
+        cells = self.cells
+        if x0 == x1 and y0 == y1:
+            return cells.get((x0, y0), ())
+        found = {}
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                for sprite in cells.get((cx, cy), ()):
+                    found[sprite] = None
+        return found.keys()
+
+    def collide(self, sprite):
+        """Get sprites whose rects overlap the given sprite's rect"""
+        rect = sprite.rect
+        return [other for other in self.query(rect) if rect.colliderect(other.rect)]
+
+def spatial_groupcollide(groupa, groupb, dokilla, dokillb, cell_size=64):
+    """Drop-in replacement for pygame.sprite.groupcollide using a SpatialHash
+
+    Sprites of groupb are bucketed once, so each sprite of groupa is only
+    tested against the sprites in the cells it overlaps.
+    """
+    grid = SpatialHash.from_sprites(groupb, cell_size)
+    collisions = {}
+    for sprite in groupa.sprites():
+        hits = grid.collide(sprite)
+        if dokillb:
+            # Like groupcollide, a killed sprite can't be hit again by later sprites
+            hits = [other for other in hits if other in groupb]
+            for other in hits:
+                other.kill()
+        if hits:
+            collisions[sprite] = hits
+    if dokilla:
+        for sprite in collisions:
+            sprite.kill()
+    return collisions
+
+def rect_array(sprites):
+    """Pack sprite rects into an (N, 4) int32 array of left, top, right, bottom"""
+    return np.array([(r.left, r.top, r.right, r.bottom) for r in (s.rect for s in sprites)],
+                    dtype=np.int32).reshape(-1, 4)
+
+def overlap_matrix(rects_a, rects_b):
+    """Boolean (len(a), len(b)) matrix of which rects overlap, computed by broadcasting"""
+    a = rects_a[:, None, :]
+    b = rects_b[None, :, :]
+    return ((a[..., 0] < b[..., 2]) & (a[..., 2] > b[..., 0]) &
+            (a[..., 1] < b[..., 3]) & (a[..., 3] > b[..., 1]))
 
 def handle_collisions(player, enemies, bullets):
+    enemy_list = enemies.sprites()
+    enemy_count = len(enemy_list)
+    if not enemy_count:
+        return "alive"
+    grid = SpatialHash.from_sprites(enemy_list)
+    enemy_rects = rect_array(enemy_list)
+    enemy_index = {enemy: i for i, enemy in enumerate(enemy_list)}
+    killed = np.zeros(enemy_count, dtype=bool)
+
     # Projectile → Enemy
-    hits = pygame.sprite.groupcollide(enemies, bullets, False, True)
-    for enemy, bullet_list in hits.items():
-        enemy.health -= 15 * len(bullet_list)
-        if enemy.health <= 0:
-            enemy.kill()
-            # TODO: add sound_enemy_death
+    bullet_list = bullets.sprites()
+    if bullet_list:
+        bullet_grid = SpatialHash.from_sprites(bullet_list, grid.cell_size)
+        bullet_rects = rect_array(bullet_list)
+        bullet_index = {bullet: i for i, bullet in enumerate(bullet_list)}
+        # Each bullet is consumed by the first enemy it overlaps; enemy_count means no hit
+        first_enemy = np.full(len(bullet_list), enemy_count, dtype=np.intp)
+        for cell, cell_bullets in bullet_grid.cells.items():
+            cell_enemies = grid.cells.get(cell)
+            if not cell_enemies:
+                continue
+            ei = np.fromiter((enemy_index[e] for e in cell_enemies), np.intp, len(cell_enemies))
+            bi = np.fromiter((bullet_index[b] for b in cell_bullets), np.intp, len(cell_bullets))
+            overlap = overlap_matrix(enemy_rects[ei], bullet_rects[bi])
+            nearest = np.where(overlap, ei[:, None], enemy_count).min(axis=0)
+            first_enemy[bi] = np.minimum(first_enemy[bi], nearest)
+        hit_bullets = first_enemy < enemy_count
+        hit_counts = np.bincount(first_enemy[hit_bullets], minlength=enemy_count)
+        for i in np.flatnonzero(hit_bullets):
+            bullet_list[i].kill()
+        for i in np.flatnonzero(hit_counts):
+            enemy = enemy_list[i]
+            enemy.health -= 15 * int(hit_counts[i])
+            if enemy.health <= 0:
+                enemy.kill()
+                killed[i] = True
+                # TODO: add sound_enemy_death
 
     # Player → Enemy
-    if pygame.sprite.spritecollide(player, enemies, False):
-        player.health -= 10
-        # TODO: add sound_player_hit
-        if player.health <= 0:
-            # TODO: add sound_player_death
-            return "dead"
+    nearby = np.fromiter((enemy_index[e] for e in grid.query(player.rect)), np.intp)
+    if len(nearby):
+        left, top, right, bottom = rect_array([player])[0]
+        rects = enemy_rects[nearby]
+        touching = ((left < rects[:, 2]) & (right > rects[:, 0]) &
+                    (top < rects[:, 3]) & (bottom > rects[:, 1]) & ~killed[nearby])
+        if touching.any():
+            player.health -= 10
+            # TODO: add sound_player_hit
+            if player.health <= 0:
+                # TODO: add sound_player_death
+                return "dead"
 
     return "alive"
@@ -1,10 +1,31 @@
 import pygame
 import random
 import math
+import functools
+import itertools
+import numpy as np
+
+# Unit-circle direction tables for the fixed-count ring emitters
+def _unit_ring(count):
+    angles = np.arange(count) * (2 * math.pi / count)
+    return np.stack((np.cos(angles), np.sin(angles)))
+
+_RING_8 = _unit_ring(8)
+_RING_12 = _unit_ring(12)
+_RING_16 = _unit_ring(16)
+
+# Number of discrete alpha steps used when batching particle blits
+PARTICLE_ALPHA_LEVELS = 16
+# Particle colors are snapped to multiples of this step so per-particle color
+# jitter maps onto a small, bounded set of cached circle surfaces
+PARTICLE_COLOR_STEP = 32
+# Upper bound on cached circle surfaces; the cache is cleared when it fills
+PARTICLE_CIRCLE_CACHE_SIZE = 2048
 
 class ScreenShake:
     """Screen shake effect for impacts and explosions"""
     def __init__(self):
+        # Offset is written in place so no Vector2 is allocated per frame
         self.offset = pygame.Vector2(0, 0)
         self.intensity = 0
         self.duration = 0
@@ -26,10 +47,12 @@ class ScreenShake:
             current_intensity = self.intensity * (1 - progress)
             
             # Random offset
-            self.offset.x = random.uniform(-current_intensity, current_intensity)
-            self.offset.y = random.uniform(-current_intensity, current_intensity)
-        else:
-            self.offset = pygame.Vector2(0, 0)
+            span = 2 * current_intensity
+            self.offset.x = random.random() * span - current_intensity
+            self.offset.y = random.random() * span - current_intensity
+        elif self.offset.x or self.offset.y:
+            self.offset.x = 0.0
+            self.offset.y = 0.0
             
     def apply_offset(self, surface):
         """Apply shake offset to surface - this method is deprecated, use get_offset() instead"""
@@ -40,245 +63,343 @@ class ScreenShake:
         """Get current shake offset for drawing"""
         return self.offset
 
-class Particle:
-    """Single particle for effects"""
-    def __init__(self, pos, vel, color, size, lifetime):
-        self.pos = pygame.Vector2(pos)
-        self.vel = pygame.Vector2(vel)
-        self.color = color
-        self.size = size
-        self.lifetime = lifetime
-        self.age = 0
-        self.initial_size = size
-        
-    def update(self, dt):
-        """Update particle"""
-        self.pos += self.vel * dt
-        self.age += dt
-        
-        # Apply gravity to some particles
-        if self.vel.y > 0:
-            self.vel.y += 200 * dt  # Gravity effect
-            
-        # Fade out
-        alpha = 1.0 - (self.age / self.lifetime)
-        self.size = self.initial_size * alpha
-        
-        return self.age < self.lifetime
-        
-    def draw(self, screen, shake_offset=pygame.Vector2(0, 0)):
-        """Draw particle"""
-        if self.size > 0:
-            alpha = 1.0 - (self.age / self.lifetime)
-            color = (*self.color, int(255 * alpha))
-            
-            # Create surface with alpha
-            particle_surface = pygame.Surface((int(self.size * 2), int(self.size * 2)), pygame.SRCALPHA)
-            pygame.draw.circle(particle_surface, color, (int(self.size), int(self.size)), int(self.size))
-            screen.blit(particle_surface, (self.pos.x - self.size + int(shake_offset.x), self.pos.y - self.size + int(shake_offset.y)))
+def _update_particles(pos_x, pos_y, vel_x, vel_y, size, initial_size, age, inv_lifetime, alpha, dt):
+    """Advance particle arrays in place by dt and return the alive mask"""
+    dt = np.float32(dt)
+    pos_x += vel_x * dt
+    pos_y += vel_y * dt
+    age += dt
+    
+    # Apply gravity to falling particles as one masked multiply-add
+    vel_y += (vel_y > 0) * (200 * dt)
+    
+    # Fade out
+    np.multiply(age, inv_lifetime, out=alpha)
+    np.subtract(1.0, alpha, out=alpha)
+    np.multiply(initial_size, alpha, out=size)
+    
+    return alpha > 0
 
 class ParticleSystem:
-    """Manages particle effects"""
+    """Manages particle effects
+
+    Particle state is stored as parallel NumPy arrays (structure of arrays)
+    so that update() runs as a handful of vectorized operations instead of
+    a Python call per particle. The arrays are preallocated buffers: only the
+    first `count` rows are live, dead rows are compacted away in place and
+    their slots reused by later emissions.
+    """
+    _FIELDS = ('pos_x', 'pos_y', 'vel_x', 'vel_y', 'color', 'size', 'age', 'inv_lifetime', 'alpha', 'initial_size')
+    INITIAL_CAPACITY = 512
+
     def __init__(self):
-        self.particles = []
+        self.rng = np.random.default_rng()
+        self.count = 0
+        self.capacity = 0
+        self.pos_x = np.empty(0, dtype=np.float32)
+        self.pos_y = np.empty(0, dtype=np.float32)
+        self.vel_x = np.empty(0, dtype=np.float32)
+        self.vel_y = np.empty(0, dtype=np.float32)
+        self.color = np.empty((0, 3), dtype=np.uint8)
+        self.size = np.empty(0, dtype=np.float32)
+        self.age = np.empty(0, dtype=np.float32)
+        self.inv_lifetime = np.empty(0, dtype=np.float32)
+        self.alpha = np.empty(0, dtype=np.float32)
+        self.initial_size = np.empty(0, dtype=np.float32)
+        self._reserve(self.INITIAL_CAPACITY)
         
+        # Circle surfaces shared by all particles, keyed by (color, radius, alpha level)
+        self._circle_cache = {}
+
+    def __len__(self):
+        return self.count
+
+    def _reserve(self, capacity):
+        """Grow the particle buffers to hold at least capacity particles"""
+        for name in self._FIELDS:
+            old = getattr(self, name)
+            new = np.empty((capacity,) + old.shape[1:], dtype=old.dtype)
+            new[:self.count] = old[:self.count]
+            setattr(self, name, new)
+        self.capacity = capacity
+
+    def _append(self, pos_x, pos_y, vel_x, vel_y, color, size, lifetime):
+        """Append a batch of particles; scalars are broadcast to the batch size"""
+        start = self.count
+        end = start + len(np.atleast_1d(vel_x))
+        if end > self.capacity:
+            self._reserve(max(end, self.capacity * 2))
+        
+        self.pos_x[start:end] = pos_x
+        self.pos_y[start:end] = pos_y
+        self.vel_x[start:end] = vel_x
+        self.vel_y[start:end] = vel_y
+        self.color[start:end] = np.minimum(
+            (np.asarray(color, dtype=np.int16) + PARTICLE_COLOR_STEP // 2) // PARTICLE_COLOR_STEP * PARTICLE_COLOR_STEP,
+            255)
+        self.size[start:end] = size
+        self.initial_size[start:end] = size
+        self.age[start:end] = 0.0
+        self.inv_lifetime[start:end] = 1.0 / np.asarray(lifetime, dtype=np.float32)
+        self.alpha[start:end] = 1.0
+        self.count = end
+
+    def _add_batch(self, pos, n, speed_range, size_range, lifetime_range, color):
+        """Emit n particles from pos in random directions, sampling all values at once"""
+        rng = self.rng
+        angles = rng.uniform(0, 2 * math.pi, n)
+        speeds = rng.uniform(*speed_range, n)
+        self._append(pos[0], pos[1], np.cos(angles) * speeds, np.sin(angles) * speeds,
+                     color, rng.uniform(*size_range, n), rng.uniform(*lifetime_range, n))
+
     def create_explosion(self, pos, color=(255, 100, 0), particle_count=20):
         """Create explosion effect"""
-        for _ in range(particle_count):
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(50, 300)
-            vel = pygame.Vector2(math.cos(angle) * speed, math.sin(angle) * speed)
-            size = random.uniform(2, 6)
-            lifetime = random.uniform(0.3, 0.8)
-            
-            particle = Particle(pos, vel, color, size, lifetime)
-            self.particles.append(particle)
+        self._add_batch(pos, particle_count, (50, 300), (2, 6), (0.3, 0.8), color)
     
     def create_particle(self, pos, color, lifetime):
         """Create a single particle with default parameters"""
-        angle = random.uniform(0, 2 * math.pi)
-        speed = random.uniform(20, 100)
-        vel = pygame.Vector2(math.cos(angle) * speed, math.sin(angle) * speed)
-        size = random.uniform(2, 4)
-        
-        particle = Particle(pos, vel, color, size, lifetime)
-        self.particles.append(particle)
+        self._add_batch(pos, 1, (20, 100), (2, 4), (lifetime, lifetime), color)
             
     def create_impact(self, pos, color=(255, 255, 0), particle_count=10):
         """Create impact effect"""
-        for _ in range(particle_count):
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(20, 150)
-            vel = pygame.Vector2(math.cos(angle) * speed, math.sin(angle) * speed)
-            size = random.uniform(1, 3)
-            lifetime = random.uniform(0.2, 0.5)
-            
-            particle = Particle(pos, vel, color, size, lifetime)
-            self.particles.append(particle)
+        self._add_batch(pos, particle_count, (20, 150), (1, 3), (0.2, 0.5), color)
             
     def create_death_effect(self, pos, enemy_color, particle_count=15):
         """Create enemy death effect"""
-        for _ in range(particle_count):
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(30, 200)
-            vel = pygame.Vector2(math.cos(angle) * speed, math.sin(angle) * speed)
-            size = random.uniform(2, 5)
-            lifetime = random.uniform(0.4, 0.7)
-            
-            # Use enemy color with some variation
-            color_variation = random.randint(-30, 30)
-            color = tuple(max(0, min(255, c + color_variation)) for c in enemy_color)
-            
-            particle = Particle(pos, vel, color, size, lifetime)
-            self.particles.append(particle)
+        # Use enemy color with some variation
+        color_variations = self.rng.integers(-30, 31, (particle_count, 1), dtype=np.int16)
+        colors = np.clip(np.asarray(enemy_color[:3], dtype=np.int16) + color_variations, 0, 255).astype(np.uint8)
+        
+        self._add_batch(pos, particle_count, (30, 200), (2, 5), (0.4, 0.7), colors)
             
     def create_xp_pickup_effect(self, pos):
         """Create XP pickup visual effect"""
-        for i in range(8):
-            angle = (math.pi * 2 * i) / 8
-            speed = pygame.Vector2(math.cos(angle) * 100, math.sin(angle) * 100)
-            color = (255, 215, 0)
-            size = 3
-            lifetime = 0.5
-            self.particles.append(Particle(pos, speed, color, size, lifetime))
+        vel_x, vel_y = _RING_8 * 100.0
+        self._append(pos[0], pos[1], vel_x, vel_y, (255, 215, 0), 3, 0.5)
     
     def create_heal_effect(self, pos):
         """Create healing visual effect"""
-        for i in range(12):
-            angle = (math.pi * 2 * i) / 12
-            speed = pygame.Vector2(math.cos(angle) * 50, math.sin(angle) * 50)
-            color = (0, 255, 0)
-            size = 4
-            lifetime = 1.0
-            self.particles.append(Particle(pos, speed, color, size, lifetime))
+        vel_x, vel_y = _RING_12 * 50.0
+        self._append(pos[0], pos[1], vel_x, vel_y, (0, 255, 0), 4, 1.0)
+    
+    def _add_line(self, start_pos, end_pos, steps, spread, speed, color, size, lifetime):
+        """Emit particles evenly spaced along a line with random jitter and velocity"""
+        rng = self.rng
+        t = np.linspace(0.0, 1.0, steps, endpoint=False)
+        pos_x = start_pos[0] + (end_pos[0] - start_pos[0]) * t + rng.uniform(-spread, spread, steps)
+        pos_y = start_pos[1] + (end_pos[1] - start_pos[1]) * t + rng.uniform(-spread, spread, steps)
+        self._append(pos_x, pos_y, rng.uniform(-speed, speed, steps), rng.uniform(-speed, speed, steps),
+                     color, size, lifetime)
     
     def create_laser_beam(self, start_pos, end_pos, color=(255, 0, 100), width=3):
         """Create laser beam effect"""
-        # Calculate laser direction
-        direction = (end_pos - start_pos).normalize()
-        distance = (end_pos - start_pos).length()
-        
-        # Create particles along the laser path
-        steps = int(distance / 10)
-        for i in range(steps):
-            t = i / steps
-            pos = start_pos + direction * (distance * t)
-            # Add some random offset for visual effect
-            offset = pygame.Vector2(random.uniform(-2, 2), random.uniform(-2, 2))
-            particle_pos = pos + offset
-            speed = pygame.Vector2(random.uniform(-20, 20), random.uniform(-20, 20))
-            size = 2
-            lifetime = 0.3
-            self.particles.append(Particle(particle_pos, speed, color, size, lifetime))
+        # Create particles along the laser path, one every 10 pixels
+        distance = math.hypot(end_pos[0] - start_pos[0], end_pos[1] - start_pos[1])
+        self._add_line(start_pos, end_pos, int(distance / 10), 2, 20, color, 2, 0.3)
     
     def create_summon_effect(self, pos):
         """Create summoning visual effect"""
-        for i in range(16):
-            angle = (math.pi * 2 * i) / 16
-            # Particles move inward
-            speed = pygame.Vector2(-math.cos(angle) * 80, -math.sin(angle) * 80)
-            color = (150, 0, 150)
-            size = 5
-            lifetime = 1.5
-            self.particles.append(Particle(pos + speed * -0.5, speed, color, size, lifetime))
+        # Particles move inward
+        vel_x, vel_y = _RING_16 * -80.0
+        self._append(pos[0] - vel_x * 0.5, pos[1] - vel_y * 0.5, vel_x, vel_y, (150, 0, 150), 5, 1.5)
     
     def create_dash_trail(self, old_pos, new_pos):
         """Create dash trail effect"""
-        # Create particles along the dash path
-        steps = 10
-        for i in range(steps):
-            t = i / steps
-            pos = old_pos + (new_pos - old_pos) * t
-            # Add some random spread
-            offset = pygame.Vector2(random.uniform(-10, 10), random.uniform(-10, 10))
-            particle_pos = pos + offset
-            speed = pygame.Vector2(random.uniform(-50, 50), random.uniform(-50, 50))
-            color = (255, 0, 255)
-            size = 6
-            lifetime = 0.8
-            self.particles.append(Particle(particle_pos, speed, color, size, lifetime))
+        # Create particles along the dash path with some random spread
+        self._add_line(old_pos, new_pos, 10, 10, 50, (255, 0, 255), 6, 0.8)
             
     def update(self, dt):
         """Update all particles"""
-        self.particles = [p for p in self.particles if p.update(dt)]
+        n = self.count
+        if not n:
+            return
+        alive = _update_particles(self.pos_x[:n], self.pos_y[:n], self.vel_x[:n], self.vel_y[:n], self.size[:n],
+                                  self.initial_size[:n], self.age[:n], self.inv_lifetime[:n], self.alpha[:n], dt)
+        if not alive.all():
+            # Compact survivors to the front; freed rows are reused by the next emission
+            keep = np.flatnonzero(alive)
+            for name in self._FIELDS:
+                buffer = getattr(self, name)
+                buffer[:len(keep)] = buffer[keep]
+            self.count = len(keep)
+        
+    def _get_circle_surface(self, color, radius, alpha_level):
+        """Get a pre-rendered circle surface for a color, radius and alpha level
+
+        Colors are stored premultiplied by alpha so they can be blitted with
+        BLEND_PREMULTIPLIED.
+        """
+        key = (color, radius, alpha_level)
+        surface = self._circle_cache.get(key)
+        if surface is None:
+            if len(self._circle_cache) >= PARTICLE_CIRCLE_CACHE_SIZE:
+                self._circle_cache.clear()
+            alpha = alpha_level * 255 // (PARTICLE_ALPHA_LEVELS - 1)
+            r, g, b = (c * alpha // 255 for c in color)
+            surface = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+            pygame.draw.circle(surface, (r, g, b, alpha), (radius, radius), radius)
+            self._circle_cache[key] = surface
+        return surface
         
     def draw(self, screen, shake_offset=pygame.Vector2(0, 0)):
-        """Draw all particles"""
-        for particle in self.particles:
-            particle.draw(screen, shake_offset)
+        """Draw all particles in a single batched blit"""
+        n = self.count
+        if not n:
+            return
+        ox = int(shake_offset.x)
+        oy = int(shake_offset.y)
+        # All int conversions happen here, once per frame, as array casts
+        radii = self.size[:n].astype(np.int32)
+        alpha_levels = (self.alpha[:n] * (PARTICLE_ALPHA_LEVELS - 1) + 0.5).astype(np.int32)
+        dest_x = self.pos_x[:n].astype(np.int32) - radii + ox
+        dest_y = self.pos_y[:n].astype(np.int32) - radii + oy
+        get_surface = self._get_circle_surface
+        blit_sequence = [
+            (get_surface((r, g, b), radius, level), (x, y), None, pygame.BLEND_PREMULTIPLIED)
+            for x, y, r, g, b, radius, level in zip(
+                dest_x.tolist(), dest_y.tolist(),
+                self.color[:n, 0].tolist(), self.color[:n, 1].tolist(), self.color[:n, 2].tolist(),
+                radii.tolist(), alpha_levels.tolist())
+            if radius > 0
+        ]
+        screen.blits(blit_sequence, doreturn=False)
+
+@functools.lru_cache(maxsize=1024)
+def _render_cached(font, text, color):
+    """Render antialiased text once per (font, text, color)"""
+    return font.render(text, True, color)
 
 class FloatingText:
     """Floating damage numbers and other text"""
     def __init__(self, pos, text, color=(255, 255, 255), size=20, lifetime=1.0):
-        self.pos = pygame.Vector2(pos)
+        self.px, self.py = pos[0], pos[1]
         self.text = text
         self.color = color
         self.size = size
         self.lifetime = lifetime
         self.age = 0
-        self.vel = pygame.Vector2(0, -50)  # Float upward
+        self.vy = -50  # Float upward
         
     def update(self, dt):
         """Update floating text"""
-        self.pos += self.vel * dt
+        self.py += self.vy * dt
         self.age += dt
         return self.age < self.lifetime
         
     def draw(self, screen, font, shake_offset=pygame.Vector2(0, 0)):
         """Draw floating text"""
         alpha = 1.0 - (self.age / self.lifetime)
-        color = (*self.color, int(255 * alpha))
         
-        text_surface = font.render(self.text, True, self.color)
+        text_surface = _render_cached(font, self.text, self.color)
         text_surface.set_alpha(int(255 * alpha))
-        screen.blit(text_surface, (self.pos.x - text_surface.get_width() // 2 + int(shake_offset.x), 
-                                   self.pos.y - text_surface.get_height() // 2 + int(shake_offset.y)))
+        screen.blit(text_surface, (self.px - text_surface.get_width() // 2 + int(shake_offset.x), 
+                                   self.py - text_surface.get_height() // 2 + int(shake_offset.y)))
 
 class FloatingTextManager:
-    """Manages floating text effects"""
+    """Manages floating text effects
+
+    Texts are rendered once when added; positions and ages are kept in
+    parallel NumPy arrays so update() is vectorized over all texts. As in
+    ParticleSystem, the arrays are preallocated buffers whose first `count`
+    rows are live.
+    """
+    _FIELDS = ('pos_x', 'pos_y', 'age', 'lifetime')
+    INITIAL_CAPACITY = 64
+    
     def __init__(self):
-        self.texts = []
         self.font = pygame.font.Font(None, 20)
         self.big_font = pygame.font.Font(None, 28)
+        self.surfaces = []
+        self.count = 0
+        self.capacity = 0
+        # Top-left corner of each text surface
+        self.pos_x = np.empty(0, dtype=np.float32)
+        self.pos_y = np.empty(0, dtype=np.float32)
+        self.age = np.empty(0, dtype=np.float32)
+        self.lifetime = np.empty(0, dtype=np.float32)
+        self._reserve(self.INITIAL_CAPACITY)
+        
+    def __len__(self):
+        return self.count
+        
+    def _reserve(self, capacity):
+        """Grow the text buffers to hold at least capacity texts"""
+        for name in self._FIELDS:
+            old = getattr(self, name)
+            new = np.empty(capacity, dtype=old.dtype)
+            new[:self.count] = old[:self.count]
+            setattr(self, name, new)
+        self.capacity = capacity
+        
+    def _add(self, pos, text, color, size, lifetime):
+        """Render a text and append it to the arrays"""
+        font = self.big_font if size > 24 else self.font
+        # Copy the cached render so each text can carry its own alpha
+        surface = _render_cached(font, text, color).copy()
+        self.surfaces.append(surface)
+        i = self.count
+        if i == self.capacity:
+            self._reserve(self.capacity * 2)
+        self.pos_x[i] = pos[0] - surface.get_width() // 2
+        self.pos_y[i] = pos[1] - surface.get_height() // 2
+        self.age[i] = 0.0
+        self.lifetime[i] = lifetime
+        self.count = i + 1
         
     def add_damage_number(self, pos, damage, critical=False):
         """Add damage number"""
         color = (255, 100, 100) if critical else (255, 255, 0)
         size = 28 if critical else 20
         text = str(int(damage))
-        
-        floating_text = FloatingText(pos, text, color, size, 0.8)
-        self.texts.append(floating_text)
+        self._add(pos, text, color, size, 0.8)
         
     def add_level_up_text(self, pos):
         """Add level up text"""
-        floating_text = FloatingText(pos, "LEVEL UP!", (255, 215, 0), 32, 1.5)
-        self.texts.append(floating_text)
+        self._add(pos, "LEVEL UP!", (255, 215, 0), 32, 1.5)
         
     def add_combo_text(self, pos, combo_count):
         """Add combo text"""
         color = (255, 200, 0) if combo_count < 5 else (255, 100, 255) if combo_count < 10 else (255, 0, 255)
         text = f"COMBO x{combo_count}!"
-        
-        floating_text = FloatingText(pos, text, color, 24, 1.0)
-        self.texts.append(floating_text)
+        self._add(pos, text, color, 24, 1.0)
         
     def add_announcement(self, pos, text, color=(255, 255, 0)):
         """Add announcement text"""
-        floating_text = FloatingText(pos, text, color, 36, 2.0)
-        self.texts.append(floating_text)
+        self._add(pos, text, color, 36, 2.0)
     
     def add_text(self, pos, text, color=(255, 255, 255)):
         """Add generic text"""
-        floating_text = FloatingText(pos, text, color, 20, 1.0)
-        self.texts.append(floating_text)
+        self._add(pos, text, color, 20, 1.0)
         
     def update(self, dt):
         """Update all floating texts"""
-        self.texts = [t for t in self.texts if t.update(dt)]
+        n = self.count
+        if not n:
+            return
+        self.pos_y[:n] -= np.float32(50 * dt)  # Float upward
+        age = self.age[:n]
+        age += np.float32(dt)
+        
+        alive = age < self.lifetime[:n]
+        if not alive.all():
+            # Compact survivors to the front; freed rows are reused by the next text
+            keep = np.flatnonzero(alive)
+            for name in self._FIELDS:
+                buffer = getattr(self, name)
+                buffer[:len(keep)] = buffer[keep]
+            self.count = len(keep)
+            self.surfaces = list(itertools.compress(self.surfaces, alive.tolist()))
         
     def draw(self, screen, shake_offset=pygame.Vector2(0, 0)):
-        """Draw all floating texts"""
-        for text in self.texts:
-            font = self.big_font if text.size > 24 else self.font
-            text.draw(screen, font, shake_offset)
+        """Draw all floating texts in a single batched blit"""
+        n = self.count
+        if not n:
+            return
+        ox = int(shake_offset.x)
+        oy = int(shake_offset.y)
+        alphas = ((1.0 - self.age[:n] / self.lifetime[:n]) * 255).astype(np.int32)
+        blit_sequence = []
+        for surface, x, y, alpha in zip(self.surfaces, self.pos_x[:n].tolist(), self.pos_y[:n].tolist(), alphas.tolist()):
+            surface.set_alpha(alpha)
+            blit_sequence.append((surface, (x + ox, y + oy)))
+        screen.blits(blit_sequence, doreturn=False)
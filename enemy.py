@@ -1,6 +1,8 @@
 import pygame
 import math
+import numpy as np
 from enum import Enum
+from asset_loader import asset_loader
 
 class EnemyType(Enum):
     BASIC = "basic"
@@ -18,66 +20,349 @@ class EnemyType(Enum):
     SUMMONER = "summoner"
     ASSASSIN = "assassin"
 
+# Integer ids used for the type column of EnemyPool
+ENEMY_TYPE_IDS = {enemy_type: i for i, enemy_type in enumerate(EnemyType)}
+
+# Special effect kinds raised by enemies, as indices into EFFECT_NAMES
+EFFECT_NAMES = ("heal", "explosion", "shoot", "laser_charge", "laser_fire", "mortar_fire", "summon", "stealth",
+                "backstab", "dash_charge", "dash_execute", "phase_dash", "phase_change", "shockwave", "stomp",
+                "multi_attack")
+EFFECT_IDS = {name: effect for effect, name in enumerate(EFFECT_NAMES)}
+
+# One effect event: its kind and time, up to two positions (target, or old
+# and new position) and one extra value (the explosion radius)
+EFFECT_DTYPE = np.dtype([('kind', 'u1'), ('time', 'i4'), ('x', 'f4'), ('y', 'f4'),
+                         ('x2', 'f4'), ('y2', 'f4'), ('aux', 'f4')])
+
+class EffectBuffer:
+    """Preallocated buffer of the special effect events raised by enemies
+
+    Events are EFFECT_DTYPE records in one NumPy array, with the enemy
+    raising each kept in a parallel list. The game drains it every frame;
+    once full, further events are dropped until then.
+    """
+    def __init__(self, capacity):
+        self.records = np.zeros(capacity, dtype=EFFECT_DTYPE)
+        self.enemies = []
+    
+    def __len__(self):
+        return len(self.enemies)
+    
+    def push(self, enemy, effect, now, x=0.0, y=0.0, x2=0.0, y2=0.0, aux=0.0):
+        """Queue an event; effect is a value of EFFECT_IDS"""
+        i = len(self.enemies)
+        if i < len(self.records):
+            self.records[i] = (effect, now, x, y, x2, y2, aux)
+            self.enemies.append(enemy)
+    
+    def drain(self):
+        """Remove every queued event, as (enemy, (kind, time, x, y, x2, y2, aux)) pairs"""
+        enemies = self.enemies
+        if not enemies:
+            # Most frames raise nothing; keep the empty list rather than replace it
+            return ()
+        self.enemies = []
+        return list(zip(enemies, self.records[:len(enemies)].tolist()))
+
+EFFECT_QUEUE = EffectBuffer(1024)
+
+# Animation states; custom_images and custom_animations are lists indexed by them
+STATE_NORMAL, STATE_DASH, STATE_HURT, STATE_ATTACK, STATE_DEATH = range(5)
+STATE_NAMES = ("normal", "dash", "hurt", "attack", "death")
+STATE_IDS = {name: state for state, name in enumerate(STATE_NAMES)}
+
+# Shared stand-in for custom_images/custom_animations of enemies without any
+_NO_CUSTOM_IMAGES = ()
+
+# Column of each ability in the cooldown arrays
+ABILITY_IDS = {ability: i for i, ability in enumerate(
+    ("rage", "summon", "shockwave", "shield", "stomp", "dash", "phase", "phase_dash", "multi_attack"))}
+
+# Column of each per-kind ability timer in the timer arrays
+TIMER_IDS = {timer: i for i, timer in enumerate(
+    ("heal", "shoot", "laser", "mortar", "summon", "stealth", "laser_charge", "mega_dash"))}
+
+# Cooldowns and timers share one countdown array: the ability cooldowns
+# come first, then the timers from column _TIMER_OFFSET on
+_TIMER_OFFSET = len(ABILITY_IDS)
+_COUNTDOWN_COLUMNS = len(ABILITY_IDS) + len(TIMER_IDS)
+
+# Farthest reach of any ability that needs the player nearby (the laser);
+# enemies of _PROXIMITY_TYPES further away than this have nothing to trigger
+MAX_ABILITY_RANGE_SQ = 600 * 600
+
+# Ability state bits of Enemy.flags; DASH and SHIELD also drive EnemyPool movement
+DASH = 1
+SHIELD = 2
+PHASED = 4
+STEALTH = 8
+CHARGING_DASH = 16
+EXPLODED = 32
+CHARGING_LASER = 64
+
+def _flag_property(bit):
+    """Boolean attribute stored as one bit of Enemy.flags"""
+    def get(self):
+        return bool(self.flags & bit)
+    
+    def set(self, value):
+        if value:
+            self.flags |= bit
+        else:
+            self.flags &= ~bit
+    
+    return property(get, set)
+
+def _timer_property(timer):
+    """Float attribute stored in the countdown column of a TIMER_IDS timer"""
+    column = _TIMER_OFFSET + TIMER_IDS[timer]
+    
+    def get(self):
+        return self.countdowns[column].item()
+    
+    def set(self, value):
+        self.countdowns[column] = value
+    
+    return property(get, set)
+
+# Timed attacks of one timer each, as (enemy type, timer, cooldown attribute, effect)
+_TIMED_ATTACKS = (
+    (EnemyType.HEALER, "heal", "heal_cooldown", EFFECT_IDS["heal"]),
+    (EnemyType.PROJECTILE, "shoot", "shoot_cooldown", EFFECT_IDS["shoot"]),
+    (EnemyType.MORTAR, "mortar", "mortar_cooldown", EFFECT_IDS["mortar_fire"]),
+)
+
+_TIMED_HANDLER_SOURCE = """\
+def handle(self, dt, player_pos, now):
+    countdowns = self.countdowns
+    if countdowns[{column}] <= 0 and self._distance_sq(player_pos) < self.trigger_range_sq:
+        countdowns[{column}] = self.{cooldown}
+        EFFECT_QUEUE.push(self, {effect}, now, player_pos.x, player_pos.y)
+"""
+
+def _compile_timed_handler(enemy_type, timer, cooldown, effect):
+    """Build the ability handler of a _TIMED_ATTACKS entry
+
+    The countdown column, cooldown attribute and effect id are written into
+    the source as constants, so the compiled handler does no lookups beyond
+    its own timer and cooldown. Types without a trigger range have an
+    infinite trigger_range_sq and always pass the distance test.
+    """
+    source = _TIMED_HANDLER_SOURCE.format(column=_TIMER_OFFSET + TIMER_IDS[timer],
+                                          cooldown=cooldown, effect=int(effect))
+    namespace = {"EFFECT_QUEUE": EFFECT_QUEUE}
+    exec(compile(source, f"<{timer} handler>", "exec"), namespace)
+    handle = namespace["handle"]
+    handle.__name__ = handle.__qualname__ = f"handle_{enemy_type.name.lower()}_abilities"
+    handle.__doc__ = f"Handle {enemy_type.name.lower()} enemy special abilities"
+    return handle
+
+_TIMED_HANDLERS = {attack[0]: _compile_timed_handler(*attack) for attack in _TIMED_ATTACKS}
+
 class Enemy(pygame.sprite.Sprite):
+    # Sprite itself has no __slots__, so a __dict__ remains for pygame's own
+    # bookkeeping, but these attributes get fixed slots in the instance
+    __slots__ = (
+        'enemy_type', 'type_id', 'pool', 'pool_index', '_pos_x', '_pos_y', '_speed', '_flags',
+        '_countdowns', 'trigger_range_sq', 'vel', 'custom_images', 'custom_animations',
+        'current_state', 'animation_timer', 'shield_duration', 'rage_threshold', 'abilities',
+        'summon_types', 'max_hp', 'hp', 'size', 'color', 'collision_damage', 'xp_value',
+        '_has_abilities', '_proximity_only', '_hp_pct', '_bar_width', '_bar_half', 'image', 'rect',
+        'damage', 'attack_range', 'attack_cooldown', 'attack_timer', 'heal_range', 'heal_amount',
+        'heal_cooldown', 'explosion_radius', 'phase', 'special_attack_cooldown',
+        'special_attack_timer', 'phase_thresholds', 'dash_target_pos', 'dash_charge_time',
+        'dash_charge_duration', 'shoot_cooldown', 'shoot_range', 'keep_distance', 'laser_cooldown',
+        'laser_charge_time', 'laser_range', 'mortar_cooldown', 'mortar_range', 'projectile_speed',
+        'summon_cooldown', 'max_summons', 'current_summons', 'stealth_cooldown', 'stealth_duration',
+        'stealth_alpha', 'backstab_multiplier',
+    )
+    
+    # Finished surfaces keyed by (enemy_type, size, color)
+    _visual_cache = {}
+    
+    # Squared ability ranges (min, max for band checks) so range tests need no sqrt
+    _RANGE2 = {
+        "stomp": 100 * 100,
+        "dash": (150 * 150, 300 * 300),
+        "summon": 300 * 300,
+        "shockwave": 200 * 200,
+        "mega_summon": 400 * 400,
+        "mega_shockwave": 300 * 300,
+        "phase_dash": (200 * 200, 500 * 500),
+        "multi_attack": 250 * 250,
+        "mega_dash": (200 * 200, 500 * 500),
+        "explode": 50 * 50,
+        "stealth": (200 * 200, 400 * 400),
+        "backstab": 100 * 100,
+    }
+    
+    # Unit-circle vertices for the boss hexagon and the mega boss star;
+    # star vertices carry 0 for outer and 1 for inner points
+    _HEX_UNIT = [(math.cos(math.radians(i * 60)), math.sin(math.radians(i * 60))) for i in range(6)]
+    _STAR_UNIT = [(math.cos(math.radians(i * 36 - 90)), math.sin(math.radians(i * 36 - 90)), i % 2)
+                  for i in range(10)]
+    # Circle based visuals as (base, decorations...) tags; unlisted types use _DEFAULT_SPEC
+    _VISUAL_SPEC = {
+        EnemyType.SNIPER: ("ring", "crosshair"),
+        EnemyType.SWARMER: ("disc",),
+        EnemyType.HEALER: ("ring", "plus"),
+        EnemyType.BOMBER: ("disc", "fuse"),
+    }
+    _DEFAULT_SPEC = ("disc", "outline")
+    
     def __init__(self, pos, enemy_type=EnemyType.BASIC):
         super().__init__()
         self.enemy_type = enemy_type
-        self.pos = pygame.Vector2(pos)
-        self.vel = pygame.Vector2(0, 0)
-        
-        # Load custom images if available
-        self.load_custom_images()
+        self.type_id = ENEMY_TYPE_IDS[enemy_type]
         
-        # Special effects tracking
-        self.special_effects = []
+        # Movement state is kept here until the enemy joins an EnemyPool,
+        # which then owns it (see the pos/speed properties)
+        self.pool = None
+        self.pool_index = -1
+        self._pos_x, self._pos_y = float(pos[0]), float(pos[1])
+        self._speed = 0
+        self._flags = 0
+        self._countdowns = np.zeros(_COUNTDOWN_COLUMNS, dtype=np.float32)
+        self.vel = pygame.Vector2(0, 0)
         
         # Animation state
-        self.current_state = "normal"
+        self.current_state = STATE_NORMAL
         self.animation_timer = 0
         
-        # Default ability states (to avoid AttributeError)
-        self.dashing = False
-        self.phased = False
-        self.shield_active = False
+        # Default ability states (to avoid AttributeError); the boolean
+        # states are bits of self.flags and start cleared
         self.shield_duration = 0
         self.rage_threshold = 0.3
         self.abilities = []
-        self.ability_cooldowns = {}
         self.summon_types = [EnemyType.BASIC, EnemyType.FAST]  # Default summon types
+        # Squared range of the shoot, laser or mortar attack, precomputed so
+        # range checks need no multiplication; EnemyPool keeps a copy per row
+        self.trigger_range_sq = math.inf
         
         # Set stats based on enemy type
-        if enemy_type == EnemyType.BASIC:
-            self.setup_basic()
-        elif enemy_type == EnemyType.TANK:
-            self.setup_tank()
-        elif enemy_type == EnemyType.FAST:
-            self.setup_fast()
-        elif enemy_type == EnemyType.BOSS:
-            self.setup_boss()
-        elif enemy_type == EnemyType.SNIPER:
-            self.setup_sniper()
-        elif enemy_type == EnemyType.SWARMER:
-            self.setup_swarmer()
-        elif enemy_type == EnemyType.HEALER:
-            self.setup_healer()
-        elif enemy_type == EnemyType.BOMBER:
-            self.setup_bomber()
-        elif enemy_type == EnemyType.PROJECTILE:
-            self.setup_projectile()
-        elif enemy_type == EnemyType.LASER:
-            self.setup_laser()
-        elif enemy_type == EnemyType.MORTAR:
-            self.setup_mortar()
-        elif enemy_type == EnemyType.SUMMONER:
-            self.setup_summoner()
-        elif enemy_type == EnemyType.ASSASSIN:
-            self.setup_assassin()
-        elif enemy_type == EnemyType.MEGA_BOSS:
-            self.setup_mega_boss()
+        setup = self._SETUP.get(enemy_type)
+        if setup:
+            setup(self)
+        
+        # hp / max_hp, refreshed once per frame by update_behavior
+        self._hp_pct = 1.0
+        
+        # Health bar geometry only depends on the size, fixed by the setup
+        self._bar_width = max(30, self.size * 2)
+        self._bar_half = self._bar_width // 2
+        
+        # Load custom images if available (after setup, which sets the size)
+        self.load_custom_images()
+        
+        # Basic, sniper and swarmer enemies have nothing to tick or trigger
+        self._has_abilities = bool(self.abilities) or enemy_type in self._ABILITY_HANDLERS
+        self._proximity_only = enemy_type in _PROXIMITY_TYPES
         
         # Create visual based on type
         self.create_visual()
-        self.rect = self.image.get_rect(center=self.pos)
+        self.rect = self.image.get_rect(center=self.get_position())
+    
+    def get_position(self):
+        """Get the position as an (x, y) tuple of floats"""
+        if self.pool is None:
+            return self._pos_x, self._pos_y
+        x, y = self.pool.pos[self.pool_index].tolist()
+        return x, y
+    
+    def set_position(self, x, y):
+        """Move the enemy without touching its rect"""
+        if self.pool is None:
+            self._pos_x, self._pos_y = x, y
+        else:
+            self.pool.pos[self.pool_index] = (x, y)
+    
+    def _distance_sq(self, point):
+        """Squared distance to a point, for comparing against squared ranges"""
+        x, y = self.get_position()
+        dx = point.x - x
+        dy = point.y - y
+        return dx * dx + dy * dy
+    
+    @property
+    def pos(self):
+        """Position as a new Vector2; assign to move the enemy"""
+        return pygame.Vector2(self.get_position())
+    
+    @pos.setter
+    def pos(self, value):
+        self.set_position(float(value[0]), float(value[1]))
+    
+    @property
+    def speed(self):
+        if self.pool is None:
+            return self._speed
+        return self.pool.speed[self.pool_index].item()
+    
+    @speed.setter
+    def speed(self, value):
+        if self.pool is None:
+            self._speed = value
+        else:
+            self.pool.speed[self.pool_index] = value
+    
+    @property
+    def countdowns(self):
+        """Ability cooldowns followed by the kind-specific timers, all ticking down to 0
+
+        While pooled this is a view of the pool row, so writes go through.
+        """
+        if self.pool is None:
+            return self._countdowns
+        return self.pool.countdowns[self.pool_index]
+    
+    @property
+    def cooldowns(self):
+        """Remaining cooldown per ability, indexed by ABILITY_IDS (a view of countdowns)"""
+        return self.countdowns[:_TIMER_OFFSET]
+    
+    def set_cooldowns(self, **cooldowns):
+        """Set the remaining cooldown of abilities by name"""
+        row = self.cooldowns
+        for ability, remaining in cooldowns.items():
+            row[ABILITY_IDS[ability]] = remaining
+    
+    @property
+    def timers(self):
+        """Remaining time per kind-specific timer, indexed by TIMER_IDS (a view of countdowns)"""
+        return self.countdowns[_TIMER_OFFSET:]
+    
+    @property
+    def flags(self):
+        """Ability state bits (DASH, SHIELD, PHASED, ...); lives in the pool row while pooled"""
+        if self.pool is None:
+            return self._flags
+        return int(self.pool.flags[self.pool_index])
+    
+    @flags.setter
+    def flags(self, value):
+        if self.pool is None:
+            self._flags = value
+        else:
+            self.pool.flags[self.pool_index] = value
+    
+    # Named views of single bits, for code outside the hot paths
+    dashing = _flag_property(DASH)
+    shield_active = _flag_property(SHIELD)
+    phased = _flag_property(PHASED)
+    is_stealthed = _flag_property(STEALTH)
+    is_charging_dash = _flag_property(CHARGING_DASH)
+    has_exploded = _flag_property(EXPLODED)
+    is_charging_laser = _flag_property(CHARGING_LASER)
+    
+    # Named views of single timer columns
+    heal_timer = _timer_property("heal")
+    shoot_timer = _timer_property("shoot")
+    laser_timer = _timer_property("laser")
+    mortar_timer = _timer_property("mortar")
+    summon_timer = _timer_property("summon")
+    stealth_timer = _timer_property("stealth")
+    laser_charge_timer = _timer_property("laser_charge")
+    dash_cooldown = _timer_property("mega_dash")
         
     def setup_basic(self):
         """Basic chaser enemy - balanced stats"""
@@ -101,7 +386,7 @@ class Enemy(pygame.sprite.Sprite):
         
         # Tank abilities
         self.abilities = ["shield", "stomp"]
-        self.ability_cooldowns = {"shield": 6.0, "stomp": 4.0}
+        self.set_cooldowns(shield=6.0, stomp=4.0)
         self.shield_active = False
         self.shield_duration = 2.0
         
@@ -117,7 +402,7 @@ class Enemy(pygame.sprite.Sprite):
         
         # Fast abilities
         self.abilities = ["dash", "phase"]
-        self.ability_cooldowns = {"dash": 3.0, "phase": 5.0}
+        self.set_cooldowns(dash=3.0, phase=5.0)
         self.dashing = False
         self.phased = False
         
@@ -133,200 +418,225 @@ class Enemy(pygame.sprite.Sprite):
         
         # Boss abilities
         self.abilities = ["rage", "summon", "shockwave"]
-        self.ability_cooldowns = {"rage": 5.0, "summon": 8.0, "shockwave": 10.0}
+        self.set_cooldowns(rage=5.0, summon=8.0, shockwave=10.0)
         self.rage_threshold = 0.3  # Activate rage at 30% HP
         
     def create_visual(self):
         """Create visual representation based on enemy type"""
-        if self.enemy_type == EnemyType.BASIC:
+        if self.enemy_type == EnemyType.MEGA_BOSS:
+            # Try to load custom mega boss image, fallback to generated shape
+            # Custom image pre-scaled to fit the enemy size
+            custom_image = asset_loader.get_image("mega_boss", (self.size, self.size))
+            if custom_image:
+                self.image = custom_image
+                return
+        
+        # Enemies never draw on their image, so one surface per look is shared
+        key = (self.enemy_type, self.size, self.color)
+        image = self._visual_cache.get(key)
+        if image is None:
+            image = self._build_visual(self.enemy_type, self.size, self.color)
+            self._visual_cache[key] = image
+        self.image = image
+    
+    @classmethod
+    def _build_visual(cls, enemy_type, size, color):
+        """Draw the surface for an enemy type, size and color"""
+        spec = cls._VISUAL_SPEC.get(enemy_type)
+        if spec is not None:
+            return cls._build_surface(spec, size, color)
+        
+        if enemy_type == EnemyType.BASIC:
             # Triangle for basic enemy
-            self.image = pygame.Surface((self.size, self.size), pygame.SRCALPHA)
+            image = pygame.Surface((size, size), pygame.SRCALPHA)
             points = [
-                (self.size//2, 0),
-                (self.size, self.size),
-                (0, self.size)
+                (size//2, 0),
+                (size, size),
+                (0, size)
             ]
-            pygame.draw.polygon(self.image, self.color, points)
+            pygame.draw.polygon(image, color, points)
             
-        elif self.enemy_type == EnemyType.TANK:
+        elif enemy_type == EnemyType.TANK:
             # Square for tank enemy
-            self.image = pygame.Surface((self.size, self.size), pygame.SRCALPHA)
-            pygame.draw.rect(self.image, self.color, (0, 0, self.size, self.size))
-            pygame.draw.rect(self.image, (100, 30, 100), (0, 0, self.size, self.size), 3)
+            image = pygame.Surface((size, size), pygame.SRCALPHA)
+            pygame.draw.rect(image, color, (0, 0, size, size))
+            pygame.draw.rect(image, (100, 30, 100), (0, 0, size, size), 3)
             
-        elif self.enemy_type == EnemyType.FAST:
+        elif enemy_type == EnemyType.FAST:
             # Diamond for fast enemy
-            self.image = pygame.Surface((self.size, self.size), pygame.SRCALPHA)
+            image = pygame.Surface((size, size), pygame.SRCALPHA)
             points = [
-                (self.size//2, 0),
-                (self.size, self.size//2),
-                (self.size//2, self.size),
-                (0, self.size//2)
+                (size//2, 0),
+                (size, size//2),
+                (size//2, size),
+                (0, size//2)
             ]
-            pygame.draw.polygon(self.image, self.color, points)
+            pygame.draw.polygon(image, color, points)
             
-        elif self.enemy_type == EnemyType.BOSS:
+        elif enemy_type == EnemyType.BOSS:
             # Large hexagon for boss
-            self.image = pygame.Surface((self.size, self.size), pygame.SRCALPHA)
-            center = self.size // 2
-            radius = self.size // 2 - 5
-            points = []
-            for i in range(6):
-                angle = i * 60  # 60 degrees for hexagon
-                x = center + radius * math.cos(math.radians(angle))
-                y = center + radius * math.sin(math.radians(angle))
-                points.append((x, y))
-            pygame.draw.polygon(self.image, self.color, points)
-            pygame.draw.polygon(self.image, (200, 0, 0), points, 4)
+            image = pygame.Surface((size, size), pygame.SRCALPHA)
+            center = size // 2
+            radius = size // 2 - 5
+            points = [(center + radius * ux, center + radius * uy) for ux, uy in cls._HEX_UNIT]
+            pygame.draw.polygon(image, color, points)
+            pygame.draw.polygon(image, (200, 0, 0), points, 4)
             # Add a center dot
-            pygame.draw.circle(self.image, (255, 100, 100), (center, center), 8)
-            
-        elif self.enemy_type == EnemyType.SNIPER:
-            # Crosshair for sniper
-            self.image = pygame.Surface((self.size, self.size), pygame.SRCALPHA)
-            center = self.size // 2
-            pygame.draw.circle(self.image, self.color, (center, center), self.size // 2, 2)
-            pygame.draw.line(self.image, self.color, (center, 5), (center, self.size - 5), 2)
-            pygame.draw.line(self.image, self.color, (5, center), (self.size - 5, center), 2)
-            
-        elif self.enemy_type == EnemyType.SWARMER:
-            # Small circle for swarmer
-            self.image = pygame.Surface((self.size, self.size), pygame.SRCALPHA)
-            pygame.draw.circle(self.image, self.color, (self.size // 2, self.size // 2), self.size // 2)
-            
-        elif self.enemy_type == EnemyType.HEALER:
-            # Plus sign for healer
-            self.image = pygame.Surface((self.size, self.size), pygame.SRCALPHA)
-            center = self.size // 2
-            pygame.draw.circle(self.image, self.color, (center, center), self.size // 2, 2)
-            pygame.draw.rect(self.image, self.color, (center - 2, 5, 4, self.size - 10))
-            pygame.draw.rect(self.image, self.color, (5, center - 2, self.size - 10, 4))
+            pygame.draw.circle(image, (255, 100, 100), (center, center), 8)
             
-        elif self.enemy_type == EnemyType.BOMBER:
-            # Fuse bomb for bomber
-            self.image = pygame.Surface((self.size, self.size), pygame.SRCALPHA)
-            pygame.draw.circle(self.image, self.color, (self.size // 2, self.size // 2), self.size // 2)
-            # Add fuse
-            fuse_end = (self.size // 2 + 8, 5)
-            pygame.draw.line(self.image, (100, 50, 0), (self.size // 2, 5), fuse_end, 2)
-            pygame.draw.circle(self.image, (255, 200, 0), fuse_end, 3)
-            
-        elif self.enemy_type == EnemyType.MEGA_BOSS:
-            # Try to load custom mega boss image, fallback to generated shape
-            from asset_loader import asset_loader
-            
-            custom_image = asset_loader.get_image("mega_boss")
-            if custom_image:
-                # Scale the custom image to fit the enemy size
-                self.image = pygame.transform.scale(custom_image, (self.size, self.size))
-            else:
-                # Fallback to star shape for mega boss
-                self.image = pygame.Surface((self.size, self.size), pygame.SRCALPHA)
-                center = self.size // 2
-                outer_radius = self.size // 2 - 5
-                inner_radius = outer_radius // 2
-                points = []
-                for i in range(10):  # 5 points star
-                    angle = i * 36 - 90  # Start from top
-                    if i % 2 == 0:
-                        radius = outer_radius
-                    else:
-                        radius = inner_radius
-                    x = center + radius * math.cos(math.radians(angle))
-                    y = center + radius * math.sin(math.radians(angle))
-                    points.append((x, y))
-                pygame.draw.polygon(self.image, self.color, points)
-                pygame.draw.polygon(self.image, (200, 0, 200), points, 3)
-                # Add center
-                pygame.draw.circle(self.image, (255, 150, 255), (center, center), 8)
+        elif enemy_type == EnemyType.MEGA_BOSS:
+            # Star shape, used when there is no custom mega boss image
+            image = pygame.Surface((size, size), pygame.SRCALPHA)
+            center = size // 2
+            outer_radius = size // 2 - 5
+            inner_radius = outer_radius // 2
+            radii = (outer_radius, inner_radius)
+            points = [(center + radii[inner] * ux, center + radii[inner] * uy)
+                      for ux, uy, inner in cls._STAR_UNIT]
+            pygame.draw.polygon(image, color, points)
+            pygame.draw.polygon(image, (200, 0, 200), points, 3)
+            # Add center
+            pygame.draw.circle(image, (255, 150, 255), (center, center), 8)
         
         # Add missing enemy types with fallback visuals
         else:
-            # Default circle for any missing enemy type
-            self.image = pygame.Surface((self.size, self.size), pygame.SRCALPHA)
-            pygame.draw.circle(self.image, self.color, (self.size // 2, self.size // 2), self.size // 2)
-            pygame.draw.circle(self.image, (255, 255, 255), (self.size // 2, self.size // 2), self.size // 2, 2)
+            # Default outlined circle for any missing enemy type
+            image = cls._build_surface(cls._DEFAULT_SPEC, size, color)
+        
+        return image
+    
+    @staticmethod
+    def _build_surface(spec, size, color):
+        """Draw a circle based visual from a _VISUAL_SPEC entry"""
+        image = pygame.Surface((size, size), pygame.SRCALPHA)
+        center = size // 2
+        for tag in spec:
+            if tag == "disc":
+                pygame.draw.circle(image, color, (center, center), center)
+            elif tag == "ring":
+                pygame.draw.circle(image, color, (center, center), center, 2)
+            elif tag == "outline":
+                pygame.draw.circle(image, (255, 255, 255), (center, center), center, 2)
+            elif tag == "crosshair":
+                pygame.draw.line(image, color, (center, 5), (center, size - 5), 2)
+                pygame.draw.line(image, color, (5, center), (size - 5, center), 2)
+            elif tag == "plus":
+                pygame.draw.rect(image, color, (center - 2, 5, 4, size - 10))
+                pygame.draw.rect(image, color, (5, center - 2, size - 10, 4))
+            elif tag == "fuse":
+                fuse_end = (center + 8, 5)
+                pygame.draw.line(image, (100, 50, 0), (center, 5), fuse_end, 2)
+                pygame.draw.circle(image, (255, 200, 0), fuse_end, 3)
+        return image
     
     def load_custom_images(self):
         """Load custom images for this enemy type"""
-        from asset_loader import asset_loader
+        # Only the mega boss has custom images
+        if self.enemy_type != EnemyType.MEGA_BOSS:
+            self.custom_images = self.custom_animations = _NO_CUSTOM_IMAGES
+            return
         
-        # Store different state images
-        self.custom_images = {}
-        self.custom_animations = {}
+        # Store different state images, None where a state has none
+        self.custom_images = [None] * len(STATE_NAMES)
+        self.custom_animations = [None] * len(STATE_NAMES)
         
-        if self.enemy_type == EnemyType.MEGA_BOSS:
-            # Try to load different mega boss states
-            for state in ["normal", "dash", "attack", "hurt", "death"]:
-                image_name = f"mega_boss_{state}"
-                custom_image = asset_loader.get_image(image_name)
-                if custom_image:
-                    self.custom_images[state] = custom_image
-                    print(f"Loaded mega boss {state} image")
-                
-                # Check for animation
-                if image_name in asset_loader.animations:
-                    self.custom_animations[state] = asset_loader.animations[image_name]
-                    print(f"Loaded mega boss {state} animation")
+        # Try to load different mega boss states, pre-scaled to the enemy size
+        for state, name in enumerate(STATE_NAMES):
+            image_name = f"mega_boss_{name}"
+            custom_image = asset_loader.get_image(image_name, (self.size, self.size))
+            if custom_image:
+                self.custom_images[state] = custom_image
+                print(f"Loaded mega boss {name} image")
+            
+            # Check for animation
+            if image_name in asset_loader.animations:
+                self.custom_animations[state] = asset_loader.animations[image_name]
+                print(f"Loaded mega boss {name} animation")
     
     def update_animation(self, dt):
         """Update animation state based on current actions"""
-        if self.enemy_type == EnemyType.MEGA_BOSS and hasattr(self, 'custom_images'):
-            # Determine current state based on actions
-            if hasattr(self, 'is_charging_dash') and self.is_charging_dash:
-                self.current_state = "dash"
-            elif hasattr(self, 'dashing') and self.dashing:
-                self.current_state = "dash"
-            elif self.hp / self.max_hp < 0.3:
-                self.current_state = "hurt"
-            else:
-                self.current_state = "normal"
-            
-            # Update image if we have a custom image for this state
-            if self.current_state in self.custom_images:
-                custom_image = self.custom_images[self.current_state]
-                self.image = pygame.transform.scale(custom_image, (self.size, self.size))
+        if not self.custom_images:
+            return
+        
+        # Determine current state based on actions
+        if self.flags & (CHARGING_DASH | DASH):
+            state = STATE_DASH
+        elif self._hp_pct < 0.3:
+            state = STATE_HURT
+        else:
+            state = STATE_NORMAL
+        self.current_state = state
+        
+        # Update image if we have a custom image for this state
+        image = self.custom_images[state]
+        if image is not None:
+            self.image = image
     
     def draw(self, screen):
         """Draw the enemy"""
         screen.blit(self.image, self.rect)
     
-    def update(self, dt, player_pos):
-        """Move towards player and handle abilities"""
-        direction = (player_pos - self.pos)
-        if direction.length() > 0:
-            direction = direction.normalize()
-        
-        # Update animation
-        self.update_animation(dt)
+    def update(self, dt, player_pos, now=None):
+        """Move towards player and handle abilities
+
+        now is the frame's pygame.time.get_ticks() value, read here if not given.
+        """
+        if now is None:
+            now = pygame.time.get_ticks()
+        x, y = self.get_position()
+        dx = player_pos.x - x
+        dy = player_pos.y - y
+        d2 = dx * dx + dy * dy
+        inv_dist = 1.0 / math.sqrt(d2) if d2 > 0 else 0.0
+        dx *= inv_dist
+        dy *= inv_dist
         
-        # Update abilities
-        self.update_abilities(dt, player_pos)
+        self.update_behavior(dt, player_pos, now)
         
         # Base movement with ability modifiers
+        flags = self.flags
         speed_modifier = 1.0
-        if self.dashing:
+        if flags & DASH:
             speed_modifier = 2.0
-        if self.shield_active:
+        if flags & SHIELD:
             speed_modifier = 0.5
         
-        movement = direction * self.speed * speed_modifier * dt
+        step = self.speed * speed_modifier * dt
+        mx = dx * step
+        my = dy * step
         
         # Add some behavior variation based on enemy type
         if self.enemy_type == EnemyType.FAST:
-            # Fast enemies have slight zigzag movement
-            zigzag = math.sin(pygame.time.get_ticks() * 0.005) * 30
-            perpendicular = pygame.Vector2(-direction.y, direction.x)
-            movement += perpendicular * zigzag * dt
+            # Fast enemies have slight zigzag movement along the perpendicular
+            zigzag = math.sin(now * 0.005) * 30 * dt
+            mx -= dy * zigzag
+            my += dx * zigzag
         
-        self.pos += movement
-        self.rect.center = self.pos
+        # Abilities may have teleported the enemy, so read the position again
+        x, y = self.get_position()
+        x += mx
+        y += my
+        self.set_position(x, y)
+        self.rect.center = (x, y)
+    
+    def update_behavior(self, dt, player_pos, now):
+        """Run the per-frame animation and ability logic"""
+        # hp changes between frames, so the ratio is computed once here
+        self._hp_pct = self.hp / self.max_hp if self.max_hp else 0.0
+        
+        # Update animation
+        self.update_animation(dt)
+        
+        # Update abilities
+        self.update_abilities(dt, player_pos, now)
     
     def take_damage(self, damage):
         """Apply damage to enemy"""
         self.hp -= damage
+        self._hp_pct = self.hp / self.max_hp if self.max_hp else 0.0
         if self.hp <= 0:
             self.hp = 0
+            self._hp_pct = 0.0
             return True  # Enemy died
         return False  # Enemy still alive
     
@@ -399,14 +709,14 @@ class Enemy(pygame.sprite.Sprite):
         
         # Mega boss abilities - combines all elite abilities
         self.abilities = ["rage", "summon", "shockwave", "shield", "phase_dash", "multi_attack"]
-        self.ability_cooldowns = {
-            "rage": 8.0, 
-            "summon": 10.0, 
-            "shockwave": 12.0,
-            "shield": 15.0,
-            "phase_dash": 6.0,
-            "multi_attack": 4.0
-        }
+        self.set_cooldowns(
+            rage=8.0,
+            summon=10.0,
+            shockwave=12.0,
+            shield=15.0,
+            phase_dash=6.0,
+            multi_attack=4.0
+        )
         self.rage_threshold = 0.4  # Activate rage at 40% HP
         self.phase_thresholds = [0.7, 0.4, 0.2]  # Phase changes at these HP percentages
         
@@ -430,6 +740,7 @@ class Enemy(pygame.sprite.Sprite):
         self.shoot_cooldown = 2.0
         self.shoot_timer = 0
         self.shoot_range = 400
+        self.trigger_range_sq = self.shoot_range * self.shoot_range
         self.keep_distance = True
     
     def setup_laser(self):
@@ -448,6 +759,7 @@ class Enemy(pygame.sprite.Sprite):
         self.is_charging_laser = False
         self.laser_charge_timer = 0
         self.laser_range = 600
+        self.trigger_range_sq = self.laser_range * self.laser_range
     
     def setup_mortar(self):
         """Mortar enemy - lobs explosive projectiles"""
@@ -462,6 +774,7 @@ class Enemy(pygame.sprite.Sprite):
         self.mortar_cooldown = 3.5
         self.mortar_timer = 0
         self.mortar_range = 500
+        self.trigger_range_sq = self.mortar_range * self.mortar_range
         self.projectile_speed = 200
         self.explosion_radius = 60
     
@@ -498,160 +811,178 @@ class Enemy(pygame.sprite.Sprite):
         self.stealth_alpha = 0.3
         self.backstab_multiplier = 2.0
     
-    def update_abilities(self, dt, player_pos):
+    def update_abilities(self, dt, player_pos, now):
         """Update ability cooldowns and trigger abilities"""
-        # Update cooldowns
-        for ability in self.ability_cooldowns:
-            if self.ability_cooldowns[ability] > 0:
-                self.ability_cooldowns[ability] -= dt
+        if not self._has_abilities:
+            return
+        
+        # Update cooldowns and timers (an EnemyPool ticks all of its members
+        # at once and triggers the purely timed attacks itself)
+        if self.pool is None:
+            countdowns = self._countdowns
+            countdowns -= dt
+            np.maximum(countdowns, 0.0, out=countdowns)
+            handlers = self._HANDLER_TABLE
+        else:
+            handlers = self._POOLED_HANDLER_TABLE
+        
+        # Far from the player, proximity types only wait for their timers,
+        # unless a laser is still charging
+        if (self._proximity_only and not self.flags & CHARGING_LASER
+                and self._distance_sq(player_pos) > MAX_ABILITY_RANGE_SQ):
+            return
         
         # Check for ability triggers
-        if self.enemy_type == EnemyType.BOSS:
-            self.handle_boss_abilities(dt, player_pos)
-        elif self.enemy_type == EnemyType.TANK:
-            self.handle_tank_abilities(dt, player_pos)
-        elif self.enemy_type == EnemyType.FAST:
-            self.handle_fast_abilities(dt, player_pos)
-        elif self.enemy_type == EnemyType.HEALER:
-            self.handle_healer_abilities(dt, player_pos)
-        elif self.enemy_type == EnemyType.BOMBER:
-            self.handle_bomber_abilities(dt, player_pos)
-        elif self.enemy_type == EnemyType.PROJECTILE:
-            self.handle_projectile_abilities(dt, player_pos)
-        elif self.enemy_type == EnemyType.LASER:
-            self.handle_laser_abilities(dt, player_pos)
-        elif self.enemy_type == EnemyType.MORTAR:
-            self.handle_mortar_abilities(dt, player_pos)
-        elif self.enemy_type == EnemyType.SUMMONER:
-            self.handle_summoner_abilities(dt, player_pos)
-        elif self.enemy_type == EnemyType.ASSASSIN:
-            self.handle_assassin_abilities(dt, player_pos)
-        elif self.enemy_type == EnemyType.MEGA_BOSS:
-            self.handle_mega_boss_abilities(dt, player_pos)
-    
-    def handle_tank_abilities(self, dt, player_pos):
+        handler = handlers[self.type_id]
+        if handler:
+            handler(self, dt, player_pos, now)
+    
+    def handle_tank_abilities(self, dt, player_pos, now):
         """Handle tank special abilities"""
+        cooldowns = self.cooldowns
+        abilities = self.abilities
+        
         # Shield ability - temporary invulnerability
-        if "shield" in self.abilities and self.ability_cooldowns["shield"] <= 0:
-            if self.hp / self.max_hp < 0.5:  # Activate shield at 50% HP
+        shield = ABILITY_IDS["shield"]
+        if "shield" in abilities and cooldowns[shield] <= 0:
+            if self._hp_pct < 0.5:  # Activate shield at 50% HP
                 self.activate_shield()
-                self.ability_cooldowns["shield"] = 10.0
+                cooldowns[shield] = 10.0
         
         # Stomp ability - area damage when close
-        if "stomp" in self.abilities and self.ability_cooldowns["stomp"] <= 0:
-            distance_to_player = (player_pos - self.pos).length()
-            if distance_to_player < 100:
-                self.activate_stomp()
-                self.ability_cooldowns["stomp"] = 6.0
+        stomp = ABILITY_IDS["stomp"]
+        if "stomp" in abilities and cooldowns[stomp] <= 0:
+            if self._distance_sq(player_pos) < self._RANGE2["stomp"]:
+                self.activate_stomp(now)
+                cooldowns[stomp] = 6.0
     
-    def handle_fast_abilities(self, dt, player_pos):
+    def handle_fast_abilities(self, dt, player_pos, now):
         """Handle fast enemy special abilities"""
+        cooldowns = self.cooldowns
+        abilities = self.abilities
+        
         # Dash ability - burst of speed
-        if "dash" in self.abilities and self.ability_cooldowns["dash"] <= 0:
-            distance_to_player = (player_pos - self.pos).length()
-            if 150 < distance_to_player < 300:  # Dash at medium range
+        dash = ABILITY_IDS["dash"]
+        if "dash" in abilities and cooldowns[dash] <= 0:
+            low, high = self._RANGE2["dash"]
+            if low < self._distance_sq(player_pos) < high:  # Dash at medium range
                 self.activate_dash()
-                self.ability_cooldowns["dash"] = 4.0
+                cooldowns[dash] = 4.0
         
         # Phase ability - temporary invulnerability and speed boost
-        if "phase" in self.abilities and self.ability_cooldowns["phase"] <= 0:
-            if self.hp / self.max_hp < 0.3:  # Phase at low HP
+        phase = ABILITY_IDS["phase"]
+        if "phase" in abilities and cooldowns[phase] <= 0:
+            if self._hp_pct < 0.3:  # Phase at low HP
                 self.activate_phase()
-                self.ability_cooldowns["phase"] = 8.0
+                cooldowns[phase] = 8.0
     
-    def handle_boss_abilities(self, dt, player_pos):
+    def handle_boss_abilities(self, dt, player_pos, now):
         """Handle boss special abilities"""
-        hp_percentage = self.hp / self.max_hp
+        cooldowns = self.cooldowns
+        abilities = self.abilities
+        range2 = self._RANGE2
+        distance_sq = self._distance_sq(player_pos)
         
         # Rage ability - activate at low HP
-        if hp_percentage < self.rage_threshold and "rage" in self.abilities and self.ability_cooldowns["rage"] <= 0:
+        rage = ABILITY_IDS["rage"]
+        if self._hp_pct < self.rage_threshold and "rage" in abilities and cooldowns[rage] <= 0:
             self.activate_rage()
-            self.ability_cooldowns["rage"] = 10.0
+            cooldowns[rage] = 10.0
         
         # Summon ability - spawn smaller enemies
-        if "summon" in self.abilities and self.ability_cooldowns["summon"] <= 0:
-            distance_to_player = (player_pos - self.pos).length()
-            if distance_to_player < 300:  # Only summon when close to player
-                self.activate_summon()
-                self.ability_cooldowns["summon"] = 12.0
+        summon = ABILITY_IDS["summon"]
+        if "summon" in abilities and cooldowns[summon] <= 0:
+            if distance_sq < range2["summon"]:  # Only summon when close to player
+                self.activate_summon(now)
+                cooldowns[summon] = 12.0
         
         # Shockwave ability - area damage
-        if "shockwave" in self.abilities and self.ability_cooldowns["shockwave"] <= 0:
-            distance_to_player = (player_pos - self.pos).length()
-            if distance_to_player < 200:  # Only shockwave when close
-                self.activate_shockwave()
-                self.ability_cooldowns["shockwave"] = 15.0
+        shockwave = ABILITY_IDS["shockwave"]
+        if "shockwave" in abilities and cooldowns[shockwave] <= 0:
+            if distance_sq < range2["shockwave"]:  # Only shockwave when close
+                self.activate_shockwave(now)
+                cooldowns[shockwave] = 15.0
     
-    def handle_mega_boss_abilities(self, dt, player_pos):
+    def handle_mega_boss_abilities(self, dt, player_pos, now):
         """Handle mega boss special abilities - combines all elite abilities"""
-        hp_percentage = self.hp / self.max_hp
+        cooldowns = self.cooldowns
+        abilities = self.abilities
+        hp_percentage = self._hp_pct
+        range2 = self._RANGE2
+        distance_sq = self._distance_sq(player_pos)
         
         # Phase management
         for i, threshold in enumerate(self.phase_thresholds):
             if hp_percentage < threshold and self.phase == i + 1:
                 self.phase = i + 2
-                self.activate_phase_change()
+                self.activate_phase_change(now)
         
         # Rage ability - activate at low HP
-        if hp_percentage < self.rage_threshold and "rage" in self.abilities and self.ability_cooldowns["rage"] <= 0:
+        rage = ABILITY_IDS["rage"]
+        if hp_percentage < self.rage_threshold and "rage" in abilities and cooldowns[rage] <= 0:
             self.activate_rage()
-            self.ability_cooldowns["rage"] = 10.0
+            cooldowns[rage] = 10.0
         
         # Summon ability - spawn smaller enemies
-        if "summon" in self.abilities and self.ability_cooldowns["summon"] <= 0:
-            distance_to_player = (player_pos - self.pos).length()
-            if distance_to_player < 400:  # Larger summon range for mega boss
-                self.activate_summon()
-                self.ability_cooldowns["summon"] = 15.0
+        summon = ABILITY_IDS["summon"]
+        if "summon" in abilities and cooldowns[summon] <= 0:
+            if distance_sq < range2["mega_summon"]:  # Larger summon range for mega boss
+                self.activate_summon(now)
+                cooldowns[summon] = 15.0
         
         # Shockwave ability - area damage
-        if "shockwave" in self.abilities and self.ability_cooldowns["shockwave"] <= 0:
-            distance_to_player = (player_pos - self.pos).length()
-            if distance_to_player < 300:  # Larger shockwave range
-                self.activate_shockwave()
-                self.ability_cooldowns["shockwave"] = 18.0
+        shockwave = ABILITY_IDS["shockwave"]
+        if "shockwave" in abilities and cooldowns[shockwave] <= 0:
+            if distance_sq < range2["mega_shockwave"]:  # Larger shockwave range
+                self.activate_shockwave(now)
+                cooldowns[shockwave] = 18.0
         
         # Shield ability - temporary invulnerability
-        if "shield" in self.abilities and self.ability_cooldowns["shield"] <= 0:
+        shield = ABILITY_IDS["shield"]
+        if "shield" in abilities and cooldowns[shield] <= 0:
             if hp_percentage < 0.6:  # Earlier shield activation
                 self.activate_shield()
-                self.ability_cooldowns["shield"] = 20.0
+                cooldowns[shield] = 20.0
         
         # Phase dash ability - teleport and attack
-        if "phase_dash" in self.abilities and self.ability_cooldowns["phase_dash"] <= 0:
-            distance_to_player = (player_pos - self.pos).length()
-            if 200 < distance_to_player < 500:  # Dash at longer range
-                self.activate_phase_dash(player_pos)
-                self.ability_cooldowns["phase_dash"] = 8.0
+        phase_dash = ABILITY_IDS["phase_dash"]
+        if "phase_dash" in abilities and cooldowns[phase_dash] <= 0:
+            low, high = range2["phase_dash"]
+            if low < distance_sq < high:  # Dash at longer range
+                self.activate_phase_dash(player_pos, now)
+                cooldowns[phase_dash] = 8.0
+                # The phase dash moved the boss
+                distance_sq = self._distance_sq(player_pos)
         
         # Multi attack ability - rapid attacks
-        if "multi_attack" in self.abilities and self.ability_cooldowns["multi_attack"] <= 0:
-            distance_to_player = (player_pos - self.pos).length()
-            if distance_to_player < 250:  # Close range multi attack
-                self.activate_multi_attack()
-                self.ability_cooldowns["multi_attack"] = 6.0
+        multi_attack = ABILITY_IDS["multi_attack"]
+        if "multi_attack" in abilities and cooldowns[multi_attack] <= 0:
+            if distance_sq < range2["multi_attack"]:  # Close range multi attack
+                self.activate_multi_attack(now)
+                cooldowns[multi_attack] = 6.0
         
-        # Dash ability - charge and dash to player's previous position
-        if self.dash_cooldown > 0:
-            self.dash_cooldown -= dt
+        # Dash ability - charge and dash to player's previous position.
+        # The abilities above may have changed the flags, so read them here
+        flags = self.flags
         
         # Start dash charge
-        if self.dash_cooldown <= 0 and not self.is_charging_dash:
-            distance_to_player = (player_pos - self.pos).length()
-            if 200 < distance_to_player < 500:  # Start dash at medium range
-                self.is_charging_dash = True
+        if self.dash_cooldown <= 0 and not flags & CHARGING_DASH:
+            low, high = range2["mega_dash"]
+            if low < distance_sq < high:  # Start dash at medium range
+                flags |= CHARGING_DASH
                 self.dash_charge_time = 0
-                self.dash_target_pos = player_pos.copy()  # Store player's current position
-                self.special_effects.append(("dash_charge", pygame.time.get_ticks()))
+                self.dash_target_pos = (player_pos.x, player_pos.y)  # Store player's current position
+                EFFECT_QUEUE.push(self, EFFECT_IDS["dash_charge"], now)
         
         # Update dash charge
-        if self.is_charging_dash:
+        if flags & CHARGING_DASH:
             self.dash_charge_time += dt
             if self.dash_charge_time >= self.dash_charge_duration:
                 # Execute dash to stored position
-                self.execute_dash()
-                self.is_charging_dash = False
+                self.execute_dash(now)
+                flags &= ~CHARGING_DASH
                 self.dash_cooldown = 8.0  # Reset cooldown
+        self.flags = flags
     
     def activate_rage(self):
         """Boss rage - increase speed and damage"""
@@ -660,39 +991,39 @@ class Enemy(pygame.sprite.Sprite):
         self.color = (255, 50, 50)  # Darker red to indicate rage
         self.create_visual()  # Update visual
     
-    def activate_summon(self):
+    def activate_summon(self, now):
         """Boss summon - spawn smaller enemies"""
         # This would need access to the enemy group - for now just visual effect
-        self.special_effects.append(("summon", pygame.time.get_ticks()))
+        EFFECT_QUEUE.push(self, EFFECT_IDS["summon"], now)
     
-    def activate_shockwave(self):
+    def activate_shockwave(self, now):
         """Boss shockwave - area damage"""
-        self.special_effects.append(("shockwave", pygame.time.get_ticks()))
+        EFFECT_QUEUE.push(self, EFFECT_IDS["shockwave"], now)
     
     def activate_shield(self):
         """Tank shield - temporary damage reduction"""
-        self.shield_active = True
+        self.flags |= SHIELD
         self.color = (100, 150, 255)  # Blue shield color
         self.create_visual()
         # Shield will be deactivated after duration in update
     
-    def activate_stomp(self):
+    def activate_stomp(self, now):
         """Tank stomp - area damage"""
-        self.special_effects.append(("stomp", pygame.time.get_ticks()))
+        EFFECT_QUEUE.push(self, EFFECT_IDS["stomp"], now)
     
     def activate_dash(self):
         """Fast dash - burst of speed"""
-        self.dashing = True
+        self.flags |= DASH
         # Dash will be deactivated after short duration
     
     def activate_phase(self):
         """Fast phase - temporary invulnerability"""
-        self.phased = True
+        self.flags |= PHASED
         self.color = (200, 200, 255)  # Ethereal blue color
         self.create_visual()
         # Phase will be deactivated after duration
     
-    def activate_phase_change(self):
+    def activate_phase_change(self, now):
         """Mega boss phase change - dramatic transformation"""
         self.speed *= 1.3
         self.collision_damage *= 1.2
@@ -701,167 +1032,131 @@ class Enemy(pygame.sprite.Sprite):
         if self.phase <= len(phase_colors):
             self.color = phase_colors[self.phase - 1]
         self.create_visual()
-        self.special_effects.append(("phase_change", pygame.time.get_ticks()))
+        EFFECT_QUEUE.push(self, EFFECT_IDS["phase_change"], now)
     
-    def activate_phase_dash(self, player_pos):
+    def activate_phase_dash(self, player_pos, now):
         """Mega boss phase dash - teleport towards player"""
-        # Store old position for effect
-        old_pos = self.pos.copy()
+        x, y = self.get_position()
+        dx = player_pos.x - x
+        dy = player_pos.y - y
+        scale = 150 / math.sqrt(dx * dx + dy * dy)
         
-        # Teleport closer to player
-        direction = (player_pos - self.pos).normalize()
-        new_pos = player_pos - direction * 150  # Stop 150 pixels from player
-        self.pos = new_pos
-        self.rect.center = self.pos
+        # Teleport closer to player, stopping 150 pixels away
+        new_x = player_pos.x - dx * scale
+        new_y = player_pos.y - dy * scale
+        self.set_position(new_x, new_y)
+        self.rect.center = (new_x, new_y)
         
-        # Create visual effect
-        self.special_effects.append(("phase_dash", pygame.time.get_ticks(), old_pos))
+        # Create visual effect at the old position
+        EFFECT_QUEUE.push(self, EFFECT_IDS["phase_dash"], now, x, y)
         
         # Brief speed boost
-        self.dashing = True
+        self.flags |= DASH
         self.speed *= 2
     
-    def activate_multi_attack(self):
+    def activate_multi_attack(self, now):
         """Mega boss multi attack - rapid consecutive attacks"""
-        self.special_effects.append(("multi_attack", pygame.time.get_ticks()))
+        EFFECT_QUEUE.push(self, EFFECT_IDS["multi_attack"], now)
         # Temporarily increase collision damage
         self.collision_damage *= 2
     
-    def execute_dash(self):
+    def execute_dash(self, now):
         """Execute mega boss dash to stored position"""
-        if self.dash_target_pos:
+        if self.dash_target_pos is not None:
             # Store old position for visual effect
-            old_pos = self.pos.copy()
+            old_x, old_y = self.get_position()
             
             # Dash to the stored position (where player was 0.8 seconds ago)
-            self.pos = self.dash_target_pos
-            self.rect.center = self.pos
+            x, y = self.dash_target_pos
+            self.set_position(x, y)
+            self.rect.center = (x, y)
             
             # Create visual effect
-            self.special_effects.append(("dash_execute", pygame.time.get_ticks(), old_pos, self.pos))
+            EFFECT_QUEUE.push(self, EFFECT_IDS["dash_execute"], now, old_x, old_y, x, y)
             
             # Clear target
             self.dash_target_pos = None
     
-    def handle_healer_abilities(self, dt, player_pos):
-        """Handle healer special abilities"""
-        # Update heal timer
-        if self.heal_timer > 0:
-            self.heal_timer -= dt
-        
-        # Heal nearby enemies
-        if self.heal_timer <= 0:
-            # This would need access to other enemies - for now add visual effect
-            self.special_effects.append(("heal", pygame.time.get_ticks()))
-            self.heal_timer = self.heal_cooldown
+    # Healer, projectile and mortar abilities are a single timed attack each
+    handle_healer_abilities = _TIMED_HANDLERS[EnemyType.HEALER]
+    handle_projectile_abilities = _TIMED_HANDLERS[EnemyType.PROJECTILE]
+    handle_mortar_abilities = _TIMED_HANDLERS[EnemyType.MORTAR]
     
-    def handle_bomber_abilities(self, dt, player_pos):
+    def handle_bomber_abilities(self, dt, player_pos, now):
         """Handle bomber special abilities"""
         # Explode when close to player or on death
-        distance_to_player = (player_pos - self.pos).length()
-        if distance_to_player < 50 and not self.has_exploded:
-            self.explode()
-    
-    def handle_projectile_abilities(self, dt, player_pos):
-        """Handle projectile enemy special abilities"""
-        # Update shoot timer
-        if self.shoot_timer > 0:
-            self.shoot_timer -= dt
-        
-        # Shoot at player from distance
-        distance_to_player = (player_pos - self.pos).length()
-        if self.shoot_timer <= 0 and distance_to_player < self.shoot_range:
-            self.shoot_timer = self.shoot_cooldown
-            self.special_effects.append(("shoot", pygame.time.get_ticks(), player_pos))
-    
-    def handle_laser_abilities(self, dt, player_pos):
+        flags = self.flags
+        if not flags & EXPLODED and self._distance_sq(player_pos) < self._RANGE2["explode"]:
+            # Same as explode(), without the call and the repeated flag check
+            self.flags = flags | EXPLODED
+            x, y = self.get_position()
+            EFFECT_QUEUE.push(self, EFFECT_IDS["explosion"], now, x, y, aux=self.explosion_radius)
+    
+    def handle_laser_abilities(self, dt, player_pos, now):
         """Handle laser enemy special abilities"""
-        # Update laser timer
-        if self.laser_timer > 0:
-            self.laser_timer -= dt
-        
-        # Charge and fire laser
-        distance_to_player = (player_pos - self.pos).length()
-        if self.laser_timer <= 0 and distance_to_player < self.laser_range:
-            if not self.is_charging_laser:
-                # Start charging
-                self.is_charging_laser = True
-                self.laser_charge_timer = self.laser_charge_time
-                self.special_effects.append(("laser_charge", pygame.time.get_ticks()))
-            else:
-                # Fire laser
-                self.is_charging_laser = False
-                self.laser_timer = self.laser_cooldown
-                self.special_effects.append(("laser_fire", pygame.time.get_ticks(), player_pos))
-        
-        # Update charge timer
-        if self.is_charging_laser and self.laser_charge_timer > 0:
-            self.laser_charge_timer -= dt
-            if self.laser_charge_timer <= 0:
-                self.is_charging_laser = False
-                self.laser_timer = self.laser_cooldown
-                self.special_effects.append(("laser_fire", pygame.time.get_ticks(), player_pos))
-    
-    def handle_mortar_abilities(self, dt, player_pos):
-        """Handle mortar enemy special abilities"""
-        # Update mortar timer
-        if self.mortar_timer > 0:
-            self.mortar_timer -= dt
-        
-        # Lob explosive projectiles
-        distance_to_player = (player_pos - self.pos).length()
-        if self.mortar_timer <= 0 and distance_to_player < self.mortar_range:
-            self.mortar_timer = self.mortar_cooldown
-            self.special_effects.append(("mortar_fire", pygame.time.get_ticks(), player_pos))
-    
-    def handle_summoner_abilities(self, dt, player_pos):
-        """Handle summoner special abilities"""
-        # Update summon timer
-        if self.summon_timer > 0:
-            self.summon_timer -= dt
+        flags = self.flags
+        timers = self.timers
         
+        # Charge, then fire once the charge timer has run out
+        if flags & CHARGING_LASER:
+            if timers[TIMER_IDS["laser_charge"]] <= 0:
+                self.flags = flags & ~CHARGING_LASER
+                timers[TIMER_IDS["laser"]] = self.laser_cooldown
+                EFFECT_QUEUE.push(self, EFFECT_IDS["laser_fire"], now, player_pos.x, player_pos.y)
+        elif timers[TIMER_IDS["laser"]] <= 0 and self._distance_sq(player_pos) < self.trigger_range_sq:
+            self.flags = flags | CHARGING_LASER
+            timers[TIMER_IDS["laser_charge"]] = self.laser_charge_time
+            EFFECT_QUEUE.push(self, EFFECT_IDS["laser_charge"], now)
+    
+    def handle_summoner_abilities(self, dt, player_pos, now):
+        """Handle summoner special abilities"""
         # Summon enemies
         if self.summon_timer <= 0 and self.current_summons < self.max_summons:
-            distance_to_player = (player_pos - self.pos).length()
-            if distance_to_player < 300:
+            distance_sq = self._distance_sq(player_pos)
+            if distance_sq < self._RANGE2["summon"]:
                 self.summon_timer = self.summon_cooldown
                 self.current_summons += 1
-                self.special_effects.append(("summon", pygame.time.get_ticks()))
+                EFFECT_QUEUE.push(self, EFFECT_IDS["summon"], now)
     
-    def handle_assassin_abilities(self, dt, player_pos):
+    def handle_assassin_abilities(self, dt, player_pos, now):
         """Handle assassin special abilities"""
-        # Update stealth timer
-        if self.stealth_timer > 0:
-            self.stealth_timer -= dt
+        flags = self.flags
+        timers = self.timers
+        stealth = TIMER_IDS["stealth"]
+        range2 = self._RANGE2
+        distance_sq = self._distance_sq(player_pos)
         
         # Enter stealth
-        if self.stealth_timer <= 0 and not self.is_stealthed:
-            distance_to_player = (player_pos - self.pos).length()
-            if 200 < distance_to_player < 400:  # Stealth at medium range
-                self.is_stealthed = True
-                self.stealth_timer = self.stealth_duration
-                self.special_effects.append(("stealth", pygame.time.get_ticks()))
+        if timers[stealth] <= 0 and not flags & STEALTH:
+            low, high = range2["stealth"]
+            if low < distance_sq < high:  # Stealth at medium range
+                flags |= STEALTH
+                timers[stealth] = self.stealth_duration
+                EFFECT_QUEUE.push(self, EFFECT_IDS["stealth"], now)
         
         # Exit stealth when close to player
-        if self.is_stealthed:
-            distance_to_player = (player_pos - self.pos).length()
-            if distance_to_player < 100:
-                self.is_stealthed = False
-                self.stealth_timer = self.stealth_cooldown
-                self.special_effects.append(("backstab", pygame.time.get_ticks()))
-    
-    def explode(self):
-        """Handle bomber explosion"""
-        if not self.has_exploded:
-            self.has_exploded = True
-            self.special_effects.append(("explosion", pygame.time.get_ticks(), self.pos, self.explosion_radius))
+        if flags & STEALTH:
+            if distance_sq < range2["backstab"]:
+                flags &= ~STEALTH
+                timers[stealth] = self.stealth_cooldown
+                EFFECT_QUEUE.push(self, EFFECT_IDS["backstab"], now)
+        self.flags = flags
+    
+    def explode(self, now=None):
+        """Handle bomber explosion; a no-op once the bomber has exploded"""
+        if now is None:
+            now = pygame.time.get_ticks()
+        if not self.flags & EXPLODED:
+            self.flags |= EXPLODED
+            x, y = self.get_position()
+            EFFECT_QUEUE.push(self, EFFECT_IDS["explosion"], now, x, y, aux=self.explosion_radius)
     
     def draw_health_bar(self, screen):
         """Draw health bar above enemy"""
         if self.hp < self.max_hp:
-            bar_width = max(30, self.size * 2)
+            bar_width = self._bar_width
             bar_height = 4
-            bar_x = self.rect.centerx - bar_width // 2
+            bar_x = self.rect.centerx - self._bar_half
             bar_y = self.rect.top - 10
             
             # Background
@@ -871,5 +1166,383 @@ class Enemy(pygame.sprite.Sprite):
             pygame.draw.rect(screen, (255, 0, 0), (bar_x, bar_y, health_width, bar_height))
             
             # Draw shield indicator if active
-            if hasattr(self, 'shield_active') and self.shield_active:
+            if self.flags & SHIELD:
                 pygame.draw.circle(screen, (100, 150, 255), (self.rect.centerx, bar_y + bar_height // 2), 8, 2)
+    
+    # Per-type setup and ability methods, looked up once instead of walking an if/elif chain
+    _SETUP = {
+        EnemyType.BASIC: setup_basic,
+        EnemyType.TANK: setup_tank,
+        EnemyType.FAST: setup_fast,
+        EnemyType.BOSS: setup_boss,
+        EnemyType.SNIPER: setup_sniper,
+        EnemyType.SWARMER: setup_swarmer,
+        EnemyType.HEALER: setup_healer,
+        EnemyType.BOMBER: setup_bomber,
+        EnemyType.PROJECTILE: setup_projectile,
+        EnemyType.LASER: setup_laser,
+        EnemyType.MORTAR: setup_mortar,
+        EnemyType.SUMMONER: setup_summoner,
+        EnemyType.ASSASSIN: setup_assassin,
+        EnemyType.MEGA_BOSS: setup_mega_boss,
+    }
+    _ABILITY_HANDLERS = {
+        EnemyType.BOSS: handle_boss_abilities,
+        EnemyType.TANK: handle_tank_abilities,
+        EnemyType.FAST: handle_fast_abilities,
+        EnemyType.HEALER: handle_healer_abilities,
+        EnemyType.BOMBER: handle_bomber_abilities,
+        EnemyType.PROJECTILE: handle_projectile_abilities,
+        EnemyType.LASER: handle_laser_abilities,
+        EnemyType.MORTAR: handle_mortar_abilities,
+        EnemyType.SUMMONER: handle_summoner_abilities,
+        EnemyType.ASSASSIN: handle_assassin_abilities,
+        EnemyType.MEGA_BOSS: handle_mega_boss_abilities,
+    }
+    # Healer, projectile, mortar, laser, summoner and assassin abilities only
+    # depend on timers, flags and the player distance, so pooled enemies of
+    # those types are triggered by update_all_abilities
+    _POOLED_ABILITY_HANDLERS = {enemy_type: handler for enemy_type, handler in _ABILITY_HANDLERS.items()
+                                if enemy_type not in (EnemyType.HEALER, EnemyType.PROJECTILE, EnemyType.MORTAR,
+                                                      EnemyType.LASER, EnemyType.SUMMONER, EnemyType.ASSASSIN)}
+    # The same handlers as jump tables indexed by type id, None where a type has none
+    _HANDLER_TABLE = tuple(map(_ABILITY_HANDLERS.get, EnemyType))
+    _POOLED_HANDLER_TABLE = tuple(map(_POOLED_ABILITY_HANDLERS.get, EnemyType))
+
+# Speed multiplier for each combination of the DASH and SHIELD bits (shield wins)
+_SPEED_MODIFIERS = np.array([1.0, 2.0, 0.5, 0.5], dtype=np.float32)
+
+def steer_enemies(pos, target, direction, dist):
+    """Write unit vectors from pos towards target into direction
+
+    Rows already on the target get a zero direction. dist is scratch space
+    of matching length, so no temporaries are allocated.
+    """
+    np.subtract(target, pos, out=direction)
+    np.hypot(direction[:, 0], direction[:, 1], out=dist)
+    np.divide(1.0, dist, out=dist, where=dist > 0)
+    direction *= dist[:, None]
+
+def move_enemies(pos, direction, speed, flags, dt, step):
+    """Advance pos in place along direction by speed * dt and the flag modifiers"""
+    np.take(_SPEED_MODIFIERS, flags & (DASH | SHIELD), out=step)
+    step *= speed
+    step *= dt
+    pos += direction * step[:, None]
+
+def zigzag_enemies(pos, direction, rows, amount):
+    """Shift the given rows of pos sideways, perpendicular to their direction"""
+    pos[rows] += direction[rows, ::-1] * (-amount, amount)
+
+# Type ids counted by EnemyPool.boss_count
+_BOSS_TYPE_IDS = frozenset((ENEMY_TYPE_IDS[EnemyType.BOSS], ENEMY_TYPE_IDS[EnemyType.MEGA_BOSS]))
+
+# Per-type scheduling of Enemy.update_behavior inside an EnemyPool, indexed by
+# type id. Types left in neither table have nothing to do per enemy once pooled.
+_PROXIMITY_TYPES = (EnemyType.BOMBER, EnemyType.LASER, EnemyType.SUMMONER, EnemyType.ASSASSIN)
+_PROXIMITY_ACTIVE = np.array([enemy_type in _PROXIMITY_TYPES and enemy_type in Enemy._POOLED_ABILITY_HANDLERS
+                              for enemy_type in EnemyType])
+_ALWAYS_ACTIVE = np.array([enemy_type in Enemy._POOLED_ABILITY_HANDLERS and enemy_type not in _PROXIMITY_TYPES
+                           for enemy_type in EnemyType])
+
+# Index into _TIMED_ATTACKS and timer column for each type id, -1 for other types
+_TIMED_TYPES = [attack[0] for attack in _TIMED_ATTACKS]
+_TIMED_ATTACK_OF = np.array([_TIMED_TYPES.index(enemy_type) if enemy_type in _TIMED_TYPES else -1
+                             for enemy_type in EnemyType])
+_TIMED_COLUMN_OF = np.array([TIMER_IDS[_TIMED_ATTACKS[attack][1]] if attack >= 0 else -1
+                             for attack in _TIMED_ATTACK_OF])
+
+def find_ready_attacks(pos, target, type_id, timers, range_sq, offset, dist_sq):
+    """Get the rows whose timed attack fires this frame and the index of that attack
+
+    One pass over all rows whatever the number of attack kinds: the timer
+    column of each candidate row is gathered through its type id. offset
+    and dist_sq are scratch space of matching length.
+    """
+    np.subtract(pos, target, out=offset)
+    np.einsum('ij,ij->i', offset, offset, out=dist_sq)
+    attack = _TIMED_ATTACK_OF[type_id]
+    rows = np.flatnonzero((attack >= 0) & (dist_sq < range_sq))
+    rows = rows[timers[rows, _TIMED_COLUMN_OF[type_id[rows]]] <= 0]
+    return rows, attack[rows]
+
+def trigger_state_abilities(pool, dist_sq, player_pos, now):
+    """Trigger the laser, summoner and assassin abilities of a pool
+
+    Each ability is gated by one boolean mask over all rows, so Python only
+    visits the rows where it actually triggers. dist_sq holds each row's
+    squared distance to the player.
+    """
+    n = pool.count
+    members = pool.members
+    type_id = pool.type_id[:n]
+    flags = pool.flags[:n]
+    timers = pool.timers[:n]
+    range2 = Enemy._RANGE2
+    px, py = player_pos.x, player_pos.y
+    
+    # Laser: fire when the charge has run out, else start charging in range
+    laser = type_id == ENEMY_TYPE_IDS[EnemyType.LASER]
+    charging = (flags & CHARGING_LASER) != 0
+    fire = laser & charging & (timers[:, TIMER_IDS["laser_charge"]] <= 0)
+    charge = laser & ~charging & (timers[:, TIMER_IDS["laser"]] <= 0) & (dist_sq < pool.range_sq[:n])
+    for i in np.flatnonzero(fire).tolist():
+        enemy = members[i]
+        flags[i] &= ~CHARGING_LASER
+        timers[i, TIMER_IDS["laser"]] = enemy.laser_cooldown
+        EFFECT_QUEUE.push(enemy, EFFECT_IDS["laser_fire"], now, px, py)
+    for i in np.flatnonzero(charge).tolist():
+        enemy = members[i]
+        flags[i] |= CHARGING_LASER
+        timers[i, TIMER_IDS["laser_charge"]] = enemy.laser_charge_time
+        EFFECT_QUEUE.push(enemy, EFFECT_IDS["laser_charge"], now)
+    
+    # Summoner: summon in range until max_summons is reached
+    summon = ((type_id == ENEMY_TYPE_IDS[EnemyType.SUMMONER]) & (timers[:, TIMER_IDS["summon"]] <= 0)
+              & (dist_sq < range2["summon"]))
+    for i in np.flatnonzero(summon).tolist():
+        enemy = members[i]
+        if enemy.current_summons < enemy.max_summons:
+            timers[i, TIMER_IDS["summon"]] = enemy.summon_cooldown
+            enemy.current_summons += 1
+            EFFECT_QUEUE.push(enemy, EFFECT_IDS["summon"], now)
+    
+    # Assassin: stealth at medium range, backstab when close
+    assassin = type_id == ENEMY_TYPE_IDS[EnemyType.ASSASSIN]
+    stealthed = (flags & STEALTH) != 0
+    low, high = range2["stealth"]
+    stealth = (assassin & ~stealthed & (timers[:, TIMER_IDS["stealth"]] <= 0)
+               & (dist_sq > low) & (dist_sq < high))
+    backstab = assassin & stealthed & (dist_sq < range2["backstab"])
+    for i in np.flatnonzero(stealth).tolist():
+        enemy = members[i]
+        flags[i] |= STEALTH
+        timers[i, TIMER_IDS["stealth"]] = enemy.stealth_duration
+        EFFECT_QUEUE.push(enemy, EFFECT_IDS["stealth"], now)
+    for i in np.flatnonzero(backstab).tolist():
+        enemy = members[i]
+        flags[i] &= ~STEALTH
+        timers[i, TIMER_IDS["stealth"]] = enemy.stealth_cooldown
+        EFFECT_QUEUE.push(enemy, EFFECT_IDS["backstab"], now)
+
+def update_all_abilities(pool, player_pos, now):
+    """Trigger the abilities that need no per-enemy handler for every row of a pool
+
+    Healer, projectile and mortar attacks fire when their timer has run out
+    and the player is within trigger_range_sq; laser, summoner and assassin
+    abilities follow in trigger_state_abilities. Only triggering rows are
+    visited in Python. Timers must already be ticked for this frame.
+    """
+    n = pool.count
+    timers = pool.timers[:n]
+    rows, attacks = find_ready_attacks(pool.pos[:n], (player_pos.x, player_pos.y), pool.type_id[:n], timers,
+                                       pool.range_sq[:n], pool._offset[:n], pool._dist_sq[:n])
+    members = pool.members
+    for i, attack in zip(rows.tolist(), attacks.tolist()):
+        enemy = members[i]
+        _, timer, cooldown, effect = _TIMED_ATTACKS[attack]
+        timers[i, TIMER_IDS[timer]] = getattr(enemy, cooldown)
+        # Every event carries the player position; heals ignore it
+        EFFECT_QUEUE.push(enemy, effect, now, player_pos.x, player_pos.y)
+    
+    trigger_state_abilities(pool, pool._dist_sq[:n], player_pos, now)
+
+class EnemyPool(pygame.sprite.Group):
+    """Sprite group that stores enemy movement state as parallel NumPy arrays
+
+    Each member owns one row of pos/speed/flags/type_id, so update() moves
+    every enemy with a few array operations instead of one Vector2
+    computation per sprite. Cooldowns and timers are ticked and the purely
+    timed attacks triggered for all rows at once; other abilities and
+    animation still run per enemy.
+    An enemy can belong to at most one EnemyPool at a time.
+    """
+    _FIELDS = ('pos', 'speed', 'flags', 'type_id', 'countdowns', 'range_sq', 'center')
+    # Per-frame work buffers, grown with the fields but never compacted
+    _SCRATCH = ('_direction', '_dist', '_step', '_offset', '_dist_sq', '_cell')
+    INITIAL_CAPACITY = 64
+    # Grid cell size of the proximity gate; no proximity ability reaches
+    # further than one cell, so the 3x3 cells around the player cover them all
+    GATE_CELL_SIZE = math.isqrt(MAX_ABILITY_RANGE_SQ)
+    
+    def __init__(self, *sprites):
+        self.count = 0
+        self.capacity = 0
+        self.pos = np.empty((0, 2), dtype=np.float32)
+        self.speed = np.empty(0, dtype=np.float32)
+        self.flags = np.empty(0, dtype=np.int32)
+        self.type_id = np.empty(0, dtype=np.int32)
+        self.countdowns = np.empty((0, _COUNTDOWN_COLUMNS), dtype=np.float32)
+        self.range_sq = np.empty(0, dtype=np.float32)
+        # Integer rect center last written to each sprite
+        self.center = np.empty((0, 2), dtype=np.int32)
+        self._direction = np.empty((0, 2), dtype=np.float32)
+        self._dist = np.empty(0, dtype=np.float32)
+        self._step = np.empty(0, dtype=np.float32)
+        self._offset = np.empty((0, 2), dtype=np.float32)
+        self._dist_sq = np.empty(0, dtype=np.float32)
+        self._cell = np.empty((0, 2), dtype=np.float32)
+        # Enemy owning each row
+        self.members = []
+        # Row indices per type id, rebuilt lazily after membership changes
+        self._type_rows = None
+        # Number of bosses and mega bosses among the members
+        self.boss_count = 0
+        self._reserve(self.INITIAL_CAPACITY)
+        super().__init__(*sprites)
+    
+    def _reserve(self, capacity):
+        """Grow the arrays to hold at least capacity enemies"""
+        for name in self._FIELDS + self._SCRATCH:
+            old = getattr(self, name)
+            new = np.empty((capacity,) + old.shape[1:], dtype=old.dtype)
+            new[:self.count] = old[:self.count]
+            setattr(self, name, new)
+        self.capacity = capacity
+        # Column views of countdowns, like Enemy.cooldowns and Enemy.timers
+        self.cooldowns = self.countdowns[:, :_TIMER_OFFSET]
+        self.timers = self.countdowns[:, _TIMER_OFFSET:]
+    
+    def add_internal(self, sprite, layer=None):
+        super().add_internal(sprite, layer)
+        row = self.count
+        if row == self.capacity:
+            self._reserve(self.capacity * 2)
+        
+        self.pos[row] = (sprite._pos_x, sprite._pos_y)
+        self.speed[row] = sprite._speed
+        self.flags[row] = sprite._flags
+        self.type_id[row] = sprite.type_id
+        self.countdowns[row] = sprite._countdowns
+        self.range_sq[row] = sprite.trigger_range_sq
+        self.center[row] = sprite.rect.center
+        self.members.append(sprite)
+        sprite.pool = self
+        sprite.pool_index = row
+        self.count = row + 1
+        self._type_rows = None
+        if sprite.type_id in _BOSS_TYPE_IDS:
+            self.boss_count += 1
+    
+    def remove_internal(self, sprite):
+        super().remove_internal(sprite)
+        row = sprite.pool_index
+        
+        # Hand the row back to the sprite so it stays usable after kill()
+        sprite._pos_x, sprite._pos_y = self.pos[row].tolist()
+        sprite._speed = self.speed[row].item()
+        sprite._flags = int(self.flags[row])
+        sprite._countdowns = self.countdowns[row].copy()
+        sprite.pool = None
+        sprite.pool_index = -1
+        
+        # Fill the hole with the last row
+        last = self.count - 1
+        if row != last:
+            for name in self._FIELDS:
+                buffer = getattr(self, name)
+                buffer[row] = buffer[last]
+            moved = self.members[last]
+            self.members[row] = moved
+            moved.pool_index = row
+        self.members.pop()
+        self.count = last
+        self._type_rows = None
+        if sprite.type_id in _BOSS_TYPE_IDS:
+            self.boss_count -= 1
+    
+    def type_rows(self):
+        """Get a dict mapping type ids to the array of rows holding that type"""
+        if self._type_rows is None:
+            type_id = self.type_id[:self.count]
+            self._type_rows = {int(tid): np.flatnonzero(type_id == tid) for tid in np.unique(type_id)}
+        return self._type_rows
+    
+    def active_rows(self, player_pos):
+        """Get the rows whose per-enemy behavior has to run this frame
+
+        Proximity types only act within the 3x3 grid cells around the
+        player.
+        """
+        n = self.count
+        size = self.GATE_CELL_SIZE
+        cell = self._cell[:n]
+        np.floor_divide(self.pos[:n], size, out=cell)
+        cell -= (player_pos.x // size, player_pos.y // size)
+        np.abs(cell, out=cell)
+        near = (cell <= 1).all(axis=1)
+        
+        type_id = self.type_id[:n]
+        return np.flatnonzero(_ALWAYS_ACTIVE[type_id] | (_PROXIMITY_ACTIVE[type_id] & near))
+    
+    def _distances(self, point):
+        """Distance from point to every member, in row order"""
+        offset = self.pos[:self.count] - (point[0], point[1])
+        return np.hypot(offset[:, 0], offset[:, 1])
+    
+    def nearest(self, point):
+        """Get the member closest to point and its distance, or (None, inf) when empty"""
+        if not self.count:
+            return None, float('inf')
+        distances = self._distances(point)
+        row = int(distances.argmin())
+        return self.members[row], distances[row].item()
+    
+    def within(self, point, radius):
+        """Get (enemy, distance) for every member at most radius away from point"""
+        distances = self._distances(point)
+        rows = np.flatnonzero(distances <= radius)
+        members = self.members
+        return [(members[row], distance) for row, distance in zip(rows.tolist(), distances[rows].tolist())]
+    
+    def update(self, dt, player_pos, now=None):
+        """Move every enemy towards the player and update their abilities
+
+        now is the frame's pygame.time.get_ticks() value, read once here if not given.
+        """
+        n = self.count
+        if n == 0:
+            return
+        if now is None:
+            now = pygame.time.get_ticks()
+        
+        # Direction is taken before abilities run, like Enemy.update
+        pos = self.pos[:n]
+        direction = self._direction[:n]
+        steer_enemies(pos, (player_pos.x, player_pos.y), direction, self._dist[:n])
+        
+        countdowns = self.countdowns[:n]
+        countdowns -= dt
+        np.maximum(countdowns, 0.0, out=countdowns)
+        update_all_abilities(self, player_pos, now)
+        
+        # Abilities may teleport enemies or change their speed and flags
+        members = self.members
+        for i in self.active_rows(player_pos).tolist():
+            members[i].update_behavior(dt, player_pos, now)
+        
+        move_enemies(pos, direction, self.speed[:n], self.flags[:n], dt, self._step[:n])
+        
+        # Fast enemies have slight zigzag movement
+        fast_rows = self.type_rows().get(ENEMY_TYPE_IDS[EnemyType.FAST])
+        if fast_rows is not None:
+            zigzag_enemies(pos, direction, fast_rows, math.sin(now * 0.005) * 30 * dt)
+        
+        # Only touch rects whose pixel position changed; slow and stationary
+        # enemies often move less than a pixel per frame
+        centers = np.rint(pos).astype(np.int32)
+        moved = np.flatnonzero((centers != self.center[:n]).any(axis=1))
+        if len(moved):
+            self.center[:n] = centers
+            for i, center in zip(moved.tolist(), centers[moved].tolist()):
+                members[i].rect.center = center
+    
+    def draw(self, surface, offset=None):
+        """Draw every enemy with one blits call, optionally shifted by offset
+
+        Returns the drawn rects, like RenderUpdates.draw.
+        """
+        if offset is None:
+            return super().draw(surface)
+        ox, oy = int(offset[0]), int(offset[1])
+        return surface.blits([(enemy.image, enemy.rect.move(ox, oy)) for enemy in self.members])
@@ -1,8 +1,158 @@
 import pygame
-import random
 import math
+import os
+import hashlib
+import heapq
+import functools
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 
+SAMPLE_RATE = 22050
+
+# Generated audio is saved here, so later launches can skip the synthesis
+AUDIO_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "nightborne")
+
+def _audio_cache_path():
+    """Get the audio cache file for this version of the module and the current mixer setup
+
+    The name hashes this file's source, so any change to the generators
+    starts a new cache instead of loading stale sounds.
+    """
+    with open(__file__, "rb") as source:
+        digest = hashlib.sha1(source.read())
+    digest.update(repr(pygame.mixer.get_init()).encode())
+    return os.path.join(AUDIO_CACHE_DIR, f"audio_{digest.hexdigest()[:16]}.npz")
+
+# Buffers shared by the generators, sized for the longest sound (the 10 second
+# music loops). Sounds are generated one at a time, first on the loader
+# thread and then lazily on the main thread once it has finished, so one
+# set of buffers is enough.
+_MAX_SAMPLES = SAMPLE_RATE * 10
+# Read-only time axis; every sound at SAMPLE_RATE uses a prefix of it
+_TIME = np.arange(_MAX_SAMPLES, dtype=np.float32) / np.float32(SAMPLE_RATE)
+_TIME.flags.writeable = False
+# Scratch space for intermediate results that never outlive one call
+_SCRATCH = np.empty(_MAX_SAMPLES, dtype=np.float32)
+
+def _time_axis(duration, sample_rate=SAMPLE_RATE):
+    """Get the time in seconds of every sample of a sound, as float32 (possibly read-only)"""
+    samples = int(sample_rate * duration)
+    if sample_rate == SAMPLE_RATE and samples <= _MAX_SAMPLES:
+        return _TIME[:samples]
+    return np.arange(samples, dtype=np.float32) / np.float32(sample_rate)
+
+def _phase(samples, frequency, sample_rate=SAMPLE_RATE):
+    """Get the phase in radians of a steady tone at each sample, from one multiply per sample"""
+    phase = np.arange(samples, dtype=np.float32)
+    phase *= np.float32(2 * math.pi * frequency / sample_rate)
+    return phase
+
+def _sine(samples, frequency, sample_rate=SAMPLE_RATE):
+    """Get a steady sine tone of the given number of samples"""
+    phase = _phase(samples, frequency, sample_rate)
+    return np.sin(phase, out=phase)
+
+def _progress(t):
+    """Get how far through the sound each sample of a time axis is, from 0 up to 1"""
+    return np.linspace(0, 1, t.size, endpoint=False, dtype=np.float32)
+
+def _to_pcm(waves):
+    """Convert a float waveform in [-1, 1] to 16-bit samples, scaling it in place"""
+    waves *= 32767
+    return waves.astype(np.int16)
+
+def _make_sound(samples):
+    """Make a Sound from a 1D int16 buffer, copied to every channel of a stereo mixer"""
+    channels = pygame.mixer.get_init()[2]
+    if channels > 1:
+        samples = np.repeat(samples[:, None], channels, axis=1)
+    return pygame.sndarray.make_sound(samples)
+
+def _harmonics(phase, partials):
+    """Sum amplitude * sin(multiple * phase) over (multiple, amplitude) partials
+
+    phase is the fundamental's phase in radians per sample. Every partial is
+    computed in one scratch buffer and added into the result in place, so
+    no temporaries are allocated per partial.
+    """
+    waves = np.zeros_like(phase)
+    partial = _SCRATCH[:phase.size] if phase.size <= _MAX_SAMPLES else np.empty_like(phase)
+    for multiple, amplitude in partials:
+        np.multiply(phase, multiple, out=partial)
+        np.sin(partial, out=partial)
+        partial *= amplitude
+        waves += partial
+    return waves
+
+# Noise source of every generator; seeded, so the sounds are the same on each launch
+_RNG = np.random.default_rng(0xC0FFEE)
+
+def _noise(t, amplitude=1.0):
+    """Get uniform white noise in [-amplitude, amplitude) for each sample of a time axis"""
+    noise = _RNG.random(t.size, dtype=np.float32)
+    noise *= 2 * amplitude
+    noise -= amplitude
+    return noise
+
+# Enemy voice waveforms, each computed from a time axis, a base frequency
+# and uniform noise in [-1, 1) for every sample. Each one allocates its
+# phase and envelope, and _voice turns those into the waveform in place.
+def _voice(phase, envelope, tone, noise_level=0.0, noise=None):
+    """Get envelope * (tone * sin(phase) + noise_level * noise), reusing phase's buffer"""
+    waves = np.sin(phase, out=phase)
+    if noise_level:
+        # tone * s + level * n == level * (tone / level * s + n)
+        waves *= tone / noise_level
+        waves += noise
+        envelope *= noise_level
+    else:
+        waves *= tone
+    waves *= envelope
+    return waves
+
+def _chirp_phase(t, frequency, sweep):
+    """Get the phase of a tone whose pitch changes by frequency * sweep per second"""
+    phase = t * sweep
+    phase += 1
+    phase *= t
+    phase *= 2 * math.pi * frequency
+    return phase
+
+def _voice_growl(t, frequency, noise):
+    # The pitch jitters randomly from sample to sample
+    phase = noise * 0.2
+    phase += 1
+    phase *= t
+    phase *= 2 * math.pi * frequency
+    return _voice(phase, np.exp(-3 * t), 0.7, 0.3, noise)
+
+def _voice_hiss(t, frequency, noise):
+    return _voice(_chirp_phase(t, frequency, 0.5), np.exp(-5 * t), 0.5, 0.5, noise)
+
+def _voice_squeal(t, frequency, noise):
+    return _voice(_chirp_phase(t, frequency, 2), np.exp(-4 * t), 1.0)
+
+def _voice_rumble(t, frequency, noise):
+    return _voice(_phase(t.size, frequency), np.sin(math.pi * t), 0.8, 0.2, noise)
+
+def _voice_roar(t, frequency, noise):
+    return _voice(_chirp_phase(t, frequency, -0.3), np.sin(math.pi * t), 0.6, 0.4, noise)
+
+def _voice_default(t, frequency, noise):
+    return _voice(_phase(t.size, frequency), np.exp(-3 * t), 1.0)
+
+VOICE_KERNELS = {
+    "growl": _voice_growl,
+    "hiss": _voice_hiss,
+    "squeal": _voice_squeal,
+    "rumble": _voice_rumble,
+    "roar": _voice_roar,
+}
+
+# Noise shared by all voices up to the longest (the mega boss death)
+_VOICE_NOISE = _noise(_time_axis(2.0))
+
 class AudioEventType(Enum):
     PLAYER_SHOOT = "player_shoot"
     PLAYER_HIT = "player_hit"
@@ -19,6 +169,10 @@ class AudioEventType(Enum):
     BOSS_DEFEATED = "boss_defeated"
     CRITICAL_HIT = "critical_hit"
     AREA_DAMAGE = "area_damage"
+    
+    def __init__(self, value):
+        # Position of the event in DynamicAudioManager.sounds
+        self.index = len(type(self).__members__)
 
 class EnemyVoiceType(Enum):
     BASIC = "basic"
@@ -26,6 +180,10 @@ class EnemyVoiceType(Enum):
     TANK = "tank"
     BOSS = "boss"
     MEGA_BOSS = "mega_boss"
+    
+    def __init__(self, value):
+        # Position of the voice type in DynamicAudioManager.enemy_voices
+        self.index = len(type(self).__members__)
 
 class DynamicAudioManager:
     """Enhanced audio system with dynamic music and enemy voices"""
@@ -39,93 +197,180 @@ class DynamicAudioManager:
         self.voice_channel = pygame.mixer.Channel(1)
         self.ambient_channel = pygame.mixer.Channel(2)
         
-        # Sound effects library
-        self.sounds = {}
-        self.enemy_voices = {}
+        # Sound effects library: sounds and voice dicts in lists indexed by
+        # AudioEventType.index and EnemyVoiceType.index
+        self.sounds = [None] * len(AudioEventType)
+        self.enemy_voices = [{} for _ in EnemyVoiceType]
         self.music_tracks = {}
+        # Generated voices by (frequency, duration, kernel). Every voice plays
+        # on voice_channel alone, so voices can share one Sound without their
+        # volumes interfering
+        self._voice_cache = {}
         
         # Dynamic music system
         self.current_music_state = "normal"
         self.music_intensity = 0.5
         self.target_intensity = 0.5
         self.intensity_transition_speed = 0.1
-        
-        # Voice cooldowns to prevent spam
+        # The music follows slow changes in the game, so it is only
+        # re-evaluated every music_update_interval seconds
+        self.music_update_interval = 0.1
+        self.music_update_timer = 0.0
+        
+        # A sound effect repeated within sfx_repeat_interval ms of itself is
+        # dropped instead of restarting the channel
+        self.sfx_repeat_interval = 30
+        self.last_sfx = (None, 0)
+        
+        # Voice cooldowns to prevent spam: the voice_clock time at which each
+        # cooling voice may play again, with the same expiries in a min-heap
         self.voice_cooldowns = {}
         self.voice_cooldown_time = 2.0  # 2 seconds between same voice type
-        
-        # Initialize audio
-        self.init_audio()
+        self.voice_clock = 0.0
+        self._cooldown_heap = []
+        
+        # Initialize audio on a worker thread so it doesn't hold up the first
+        # frames; NumPy releases the GIL while synthesizing. Until it is done
+        # the manager stays silent.
+        executor = ThreadPoolExecutor(max_workers=1)
+        self._audio_future = executor.submit(self.init_audio)
+        self._audio_future.add_done_callback(self._report_audio_error)
+        executor.shutdown(wait=False)
+    
+    @property
+    def audio_ready(self):
+        """Whether the background initialization of the audio assets has finished"""
+        return self._audio_future.done()
+    
+    def _report_audio_error(self, future):
+        """Print why the background audio initialization failed, if it did"""
+        error = future.exception()
+        if error is not None:
+            print(f"Failed to initialize audio: {error}")
     
     def init_audio(self):
         """Initialize all audio assets"""
-        # Generate sound effects
-        self.generate_sounds()
-        
-        # Generate enemy voices
-        self.generate_enemy_voices()
+        cache_path = _audio_cache_path()
+        if not self.load_cached_audio(cache_path):
+            # Generate sound effects
+            self.generate_sounds()
+            
+            # Generate enemy voices
+            self.generate_enemy_voices()
+            
+            # Generate music tracks
+            self.generate_music_tracks()
+            
+            self.save_cached_audio(cache_path)
         
-        # Generate music tracks
-        self.generate_music_tracks()
+        self.add_lazy_sounds()
+    
+    def load_cached_audio(self, cache_path):
+        """Load every sound saved by save_cached_audio, returning whether it succeeded"""
+        if not os.path.exists(cache_path):
+            return False
+        try:
+            sounds = [None] * len(AudioEventType)
+            enemy_voices = [{} for _ in EnemyVoiceType]
+            music_tracks = {}
+            with np.load(cache_path) as data:
+                for key in data.files:
+                    kind, *names = key.split(":")
+                    sound = pygame.sndarray.make_sound(data[key])
+                    if kind == "sound":
+                        sounds[AudioEventType[names[0]].index] = sound
+                    elif kind == "voice":
+                        enemy_voices[EnemyVoiceType[names[0]].index][names[1]] = sound
+                    else:
+                        music_tracks[names[0]] = sound
+        except Exception as e:
+            print(f"Failed to load audio cache: {e}")
+            return False
+        
+        self.sounds, self.enemy_voices, self.music_tracks = sounds, enemy_voices, music_tracks
+        return True
+    
+    def save_cached_audio(self, cache_path):
+        """Save the sample arrays of every generated sound for load_cached_audio"""
+        arrays = {f"sound:{event.name}": pygame.sndarray.array(sound)
+                  for event, sound in zip(AudioEventType, self.sounds) if sound is not None}
+        for voice_type, voices in zip(EnemyVoiceType, self.enemy_voices):
+            for voice_event, sound in voices.items():
+                arrays[f"voice:{voice_type.name}:{voice_event}"] = pygame.sndarray.array(sound)
+        for state, sound in self.music_tracks.items():
+            arrays[f"music:{state}"] = pygame.sndarray.array(sound)
+        
+        try:
+            os.makedirs(AUDIO_CACHE_DIR, exist_ok=True)
+            np.savez(cache_path, **arrays)
+        except OSError as e:
+            print(f"Failed to save audio cache: {e}")
     
     def generate_sounds(self):
         """Generate procedural sound effects"""
         # Player sounds
-        self.sounds[AudioEventType.PLAYER_SHOOT] = self.generate_shoot_sound(800, 0.1)
-        self.sounds[AudioEventType.PLAYER_HIT] = self.generate_impact_sound(200, 0.2)
-        self.sounds[AudioEventType.PLAYER_HEAL] = self.generate_heal_sound(600, 0.3)
-        self.sounds[AudioEventType.PLAYER_LEVEL_UP] = self.generate_level_up_sound(0.5)
+        self.sounds[AudioEventType.PLAYER_SHOOT.index] = self.generate_shoot_sound(800, 0.1)
+        self.sounds[AudioEventType.PLAYER_HIT.index] = self.generate_impact_sound(200, 0.2)
+        self.sounds[AudioEventType.PLAYER_HEAL.index] = self.generate_heal_sound(600, 0.3)
+        self.sounds[AudioEventType.PLAYER_LEVEL_UP.index] = self.generate_level_up_sound(0.5)
         
         # Enemy sounds
-        self.sounds[AudioEventType.ENEMY_HIT] = self.generate_impact_sound(300, 0.15)
-        self.sounds[AudioEventType.ENEMY_DEATH] = self.generate_death_sound(0.4)
-        self.sounds[AudioEventType.EXPLOSION] = self.generate_explosion_sound(0.6)
+        self.sounds[AudioEventType.ENEMY_HIT.index] = self.generate_impact_sound(300, 0.15)
+        self.sounds[AudioEventType.ENEMY_DEATH.index] = self.generate_death_sound(0.4)
+        self.sounds[AudioEventType.EXPLOSION.index] = self.generate_explosion_sound(0.6)
         
         # Game event sounds
-        self.sounds[AudioEventType.POWER_UP_PICKUP] = self.generate_pickup_sound(1000, 0.2)
-        self.sounds[AudioEventType.COMBO_MILESTONE] = self.generate_combo_sound(0.3)
-        self.sounds[AudioEventType.WAVE_START] = self.generate_wave_sound(0.4)
-        self.sounds[AudioEventType.WAVE_COMPLETE] = self.generate_victory_sound(0.5)
-        self.sounds[AudioEventType.BOSS_SPAWN] = self.generate_boss_spawn_sound(0.8)
-        self.sounds[AudioEventType.BOSS_DEFEATED] = self.generate_mega_victory_sound(1.0)
-        self.sounds[AudioEventType.CRITICAL_HIT] = self.generate_critical_sound(0.3)
-        self.sounds[AudioEventType.AREA_DAMAGE] = self.generate_area_damage_sound(0.4)
+        self.sounds[AudioEventType.POWER_UP_PICKUP.index] = self.generate_pickup_sound(1000, 0.2)
+        self.sounds[AudioEventType.COMBO_MILESTONE.index] = self.generate_combo_sound(0.3)
+        self.sounds[AudioEventType.WAVE_START.index] = self.generate_wave_sound(0.4)
+        self.sounds[AudioEventType.CRITICAL_HIT.index] = self.generate_critical_sound(0.3)
+        self.sounds[AudioEventType.AREA_DAMAGE.index] = self.generate_area_damage_sound(0.4)
     
     def generate_enemy_voices(self):
         """Generate enemy voice sounds"""
-        self.enemy_voices[EnemyVoiceType.BASIC] = {
+        self.enemy_voices[EnemyVoiceType.BASIC.index] = {
             "spawn": self.generate_voice_sound(150, 0.2, "growl"),
             "attack": self.generate_voice_sound(200, 0.1, "hiss"),
             "death": self.generate_voice_sound(100, 0.3, "groan"),
             "pain": self.generate_voice_sound(180, 0.15, "yelp")
         }
         
-        self.enemy_voices[EnemyVoiceType.FAST] = {
+        self.enemy_voices[EnemyVoiceType.FAST.index] = {
             "spawn": self.generate_voice_sound(300, 0.15, "squeal"),
             "attack": self.generate_voice_sound(400, 0.1, "chirp"),
             "death": self.generate_voice_sound(200, 0.25, "scream"),
             "pain": self.generate_voice_sound(350, 0.1, "yelp")
         }
         
-        self.enemy_voices[EnemyVoiceType.TANK] = {
+        self.enemy_voices[EnemyVoiceType.TANK.index] = {
             "spawn": self.generate_voice_sound(80, 0.4, "rumble"),
             "attack": self.generate_voice_sound(100, 0.2, "grunt"),
             "death": self.generate_voice_sound(60, 0.6, "roar"),
             "pain": self.generate_voice_sound(90, 0.3, "growl")
         }
         
-        self.enemy_voices[EnemyVoiceType.BOSS] = {
+        self.enemy_voices[EnemyVoiceType.BOSS.index] = {
             "spawn": self.generate_voice_sound(50, 0.8, "roar"),
             "attack": self.generate_voice_sound(80, 0.3, "bellow"),
             "death": self.generate_voice_sound(40, 1.2, "death_roar"),
             "pain": self.generate_voice_sound(70, 0.4, "growl")
         }
-        
-        self.enemy_voices[EnemyVoiceType.MEGA_BOSS] = {
-            "spawn": self.generate_voice_sound(30, 1.5, "mega_roar"),
-            "attack": self.generate_voice_sound(50, 0.5, "mega_bellow"),
-            "death": self.generate_voice_sound(25, 2.0, "mega_death"),
-            "pain": self.generate_voice_sound(40, 0.6, "mega_growl")
+    
+    def add_lazy_sounds(self):
+        """Add the rarely heard sounds as factories, generated when first played
+
+        A short session may never reach a boss, so these are neither
+        synthesized up front nor kept in the disk cache.
+        """
+        self.sounds[AudioEventType.WAVE_COMPLETE.index] = functools.partial(self.generate_victory_sound, 0.5)
+        self.sounds[AudioEventType.BOSS_SPAWN.index] = functools.partial(self.generate_boss_spawn_sound, 0.8)
+        self.sounds[AudioEventType.BOSS_DEFEATED.index] = functools.partial(self.generate_mega_victory_sound, 1.0)
+        
+        self.enemy_voices[EnemyVoiceType.MEGA_BOSS.index] = {
+            "spawn": functools.partial(self.generate_voice_sound, 30, 1.5, "mega_roar"),
+            "attack": functools.partial(self.generate_voice_sound, 50, 0.5, "mega_bellow"),
+            "death": functools.partial(self.generate_voice_sound, 25, 2.0, "mega_death"),
+            "pain": functools.partial(self.generate_voice_sound, 40, 0.6, "mega_growl")
         }
     
     def generate_music_tracks(self):
@@ -140,335 +385,195 @@ class DynamicAudioManager:
     
     def generate_shoot_sound(self, frequency, duration):
         """Generate shoot sound effect"""
-        sample_rate = 22050
-        samples = int(sample_rate * duration)
-        waves = pygame.sndarray.make_sound(
-            self.generate_shoot_wave(frequency, duration, sample_rate)
-        )
-        return waves
+        return _make_sound(self.generate_shoot_wave(frequency, duration, SAMPLE_RATE))
     
     def generate_shoot_wave(self, frequency, duration, sample_rate):
         """Generate shoot wave data"""
-        import numpy as np
-        samples = int(sample_rate * duration)
-        waves = np.zeros(samples, dtype=np.float32)
+        t = _time_axis(duration, sample_rate)
         
-        for i in range(samples):
-            t = float(i) / sample_rate
-            # Sharp attack with quick decay
-            envelope = math.exp(-t * 20)
-            waves[i] = envelope * math.sin(2 * math.pi * frequency * t)
-            # Add some noise for texture
-            waves[i] += random.uniform(-0.1, 0.1) * envelope
+        # Sharp attack with quick decay
+        envelope = np.exp(-20 * t)
+        waves = envelope * _sine(t.size, frequency, sample_rate)
+        # Add some noise for texture
+        waves += envelope * _noise(t, 0.1)
         
-        return np.array(waves * 32767, dtype=np.int16)
+        return _to_pcm(waves)
     
     def generate_impact_sound(self, frequency, duration):
         """Generate impact sound effect"""
-        sample_rate = 22050
-        samples = int(sample_rate * duration)
+        t = _time_axis(duration)
         
-        import numpy as np
-        waves = np.zeros((samples, 1))  # 2D array for mono
+        # Sharp attack with medium decay, a harmonic and impact noise
+        waves = _harmonics(_phase(t.size, frequency), ((1, 1.0), (2, 0.3)))
+        waves += _noise(t, 0.2)
+        waves *= np.exp(-15 * t)
         
-        for i in range(samples):
-            t = float(i) / sample_rate
-            # Sharp attack with medium decay
-            envelope = math.exp(-t * 15)
-            waves[i, 0] = envelope * (
-                math.sin(2 * math.pi * frequency * t) +
-                0.3 * math.sin(4 * math.pi * frequency * t)  # Add harmonic
-            )
-            # Add impact noise
-            waves[i, 0] += random.uniform(-0.2, 0.2) * envelope
-        
-        return pygame.sndarray.make_sound(np.array(waves * 32767, dtype=np.int16))
+        return _make_sound(_to_pcm(waves))
     
     def generate_heal_sound(self, frequency, duration):
         """Generate healing sound effect"""
-        sample_rate = 22050
-        samples = int(sample_rate * duration)
-        
-        import numpy as np
-        waves = np.zeros((samples, 1))  # 2D array for mono
+        t = _time_axis(duration)
         
-        for i in range(samples):
-            t = float(i) / sample_rate
-            # Rising pitch with smooth envelope
-            pitch = frequency * (1 + t * 0.5)
-            envelope = math.sin(math.pi * t)  # Smooth rise and fall
-            waves[i, 0] = envelope * math.sin(2 * math.pi * pitch * t)
+        # Rising pitch with smooth envelope
+        pitch = frequency * (1 + t * 0.5)
+        envelope = np.sin(math.pi * t)  # Smooth rise and fall
+        waves = envelope * np.sin(2 * math.pi * pitch * t)
         
-        return pygame.sndarray.make_sound(np.array(waves * 32767, dtype=np.int16))
+        return _make_sound(_to_pcm(waves))
     
     def generate_level_up_sound(self, duration):
         """Generate level up sound effect"""
-        sample_rate = 22050
-        samples = int(sample_rate * duration)
-        
-        import numpy as np
-        waves = np.zeros((samples, 1))  # 2D array for mono
+        t = _time_axis(duration)
         
-        for i in range(samples):
-            t = float(i) / sample_rate
-            # Rising arpeggio
-            base_freq = 400
-            freq = base_freq * (1 + t * 2)
-            envelope = math.sin(math.pi * t)
-            waves[i, 0] = envelope * math.sin(2 * math.pi * freq * t)
+        # Rising arpeggio
+        base_freq = 400
+        freq = base_freq * (1 + t * 2)
+        envelope = np.sin(math.pi * t)
+        waves = envelope * np.sin(2 * math.pi * freq * t)
         
-        return pygame.sndarray.make_sound(np.array(waves * 32767, dtype=np.int16))
+        return _make_sound(_to_pcm(waves))
     
     def generate_death_sound(self, duration):
         """Generate death sound effect"""
-        sample_rate = 22050
-        samples = int(sample_rate * duration)
-        
-        import numpy as np
-        waves = np.zeros((samples, 1))  # 2D array for mono
-        
-        for i in range(samples):
-            t = float(i) / sample_rate
-            # Falling pitch with noise
-            freq = 200 * (1 - t * 0.8)
-            envelope = math.exp(-t * 3)
-            waves[i, 0] = envelope * (
-                0.7 * math.sin(2 * math.pi * freq * t) +
-                0.3 * random.uniform(-1, 1)
-            )
+        t = _time_axis(duration)
+        
+        # Falling pitch with noise
+        freq = 200 * (1 - t * 0.8)
+        envelope = np.exp(-3 * t)
+        waves = envelope * (
+            0.7 * np.sin(2 * math.pi * freq * t) +
+            0.3 * _noise(t)
+        )
         
-        return pygame.sndarray.make_sound(np.array(waves * 32767, dtype=np.int16))
+        return _make_sound(_to_pcm(waves))
     
     def generate_explosion_sound(self, duration):
         """Generate explosion sound effect"""
-        sample_rate = 22050
-        samples = int(sample_rate * duration)
-        
-        import numpy as np
-        waves = np.zeros((samples, 1))  # 2D array for mono
+        t = _time_axis(duration)
         
-        for i in range(samples):
-            t = float(i) / sample_rate
-            # Low frequency rumble with noise
-            envelope = math.exp(-t * 2)
-            waves[i, 0] = envelope * (
-                0.5 * math.sin(2 * math.pi * 50 * t) +
-                0.5 * random.uniform(-1, 1)
-            )
+        # Low frequency rumble with noise
+        envelope = np.exp(-2 * t)
+        waves = envelope * (
+            0.5 * _sine(t.size, 50) +
+            0.5 * _noise(t)
+        )
         
-        return pygame.sndarray.make_sound(np.array(waves * 32767, dtype=np.int16))
+        return _make_sound(_to_pcm(waves))
     
     def generate_pickup_sound(self, frequency, duration):
         """Generate pickup sound effect"""
-        sample_rate = 22050
-        samples = int(sample_rate * duration)
+        t = _time_axis(duration)
         
-        import numpy as np
-        waves = np.zeros((samples, 1))  # 2D array for mono
+        # Twinkly sound
+        waves = _harmonics(_phase(t.size, frequency), ((1, 1.0), (2, 0.5)))
+        waves *= np.exp(-10 * t)
         
-        for i in range(samples):
-            t = float(i) / sample_rate
-            # Twinkly sound
-            envelope = math.exp(-t * 10)
-            waves[i, 0] = envelope * (
-                math.sin(2 * math.pi * frequency * t) +
-                0.5 * math.sin(4 * math.pi * frequency * t)
-            )
-        
-        return pygame.sndarray.make_sound(np.array(waves * 32767, dtype=np.int16))
+        return _make_sound(_to_pcm(waves))
     
     def generate_combo_sound(self, duration):
         """Generate combo milestone sound"""
-        sample_rate = 22050
-        samples = int(sample_rate * duration)
-        
-        import numpy as np
-        waves = np.zeros((samples, 1))  # 2D array for mono
+        t = _time_axis(duration)
         
-        for i in range(samples):
-            t = float(i) / sample_rate
-            # Quick ascending notes
-            freq = 400 + (i / samples) * 800
-            envelope = math.exp(-t * 5)
-            waves[i, 0] = envelope * math.sin(2 * math.pi * freq * t)
+        # Quick ascending notes
+        freq = 400 + _progress(t) * 800
+        envelope = np.exp(-5 * t)
+        waves = envelope * np.sin(2 * math.pi * freq * t)
         
-        return pygame.sndarray.make_sound(np.array(waves * 32767, dtype=np.int16))
+        return _make_sound(_to_pcm(waves))
     
     def generate_wave_sound(self, duration):
         """Generate wave start sound"""
-        sample_rate = 22050
-        samples = int(sample_rate * duration)
+        t = _time_axis(duration)
         
-        import numpy as np
-        waves = np.zeros((samples, 1))  # 2D array for mono
+        # Dramatic horn sound
+        freq = 150 + np.sin(t * 10) * 50
+        envelope = np.sin(math.pi * t)
+        waves = envelope * np.sin(2 * math.pi * freq * t)
         
-        for i in range(samples):
-            t = float(i) / sample_rate
-            # Dramatic horn sound
-            freq = 150 + math.sin(t * 10) * 50
-            envelope = math.sin(math.pi * t)
-            waves[i, 0] = envelope * math.sin(2 * math.pi * freq * t)
-        
-        return pygame.sndarray.make_sound(np.array(waves * 32767, dtype=np.int16))
+        return _make_sound(_to_pcm(waves))
     
     def generate_victory_sound(self, duration):
         """Generate victory sound"""
-        sample_rate = 22050
-        samples = int(sample_rate * duration)
-        
-        import numpy as np
-        waves = np.zeros((samples, 1))  # 2D array for mono
+        t = _time_axis(duration)
         
-        for i in range(samples):
-            t = float(i) / sample_rate
-            # Triumphant fanfare
-            freq = 300 + (i / samples) * 400
-            envelope = math.sin(math.pi * t)
-            waves[i, 0] = envelope * (
-                math.sin(2 * math.pi * freq * t) +
-                0.3 * math.sin(3 * math.pi * freq * t)
-            )
+        # Triumphant fanfare
+        freq = 300 + _progress(t) * 400
+        waves = _harmonics(2 * math.pi * freq * t, ((1, 1.0), (1.5, 0.3)))
+        waves *= np.sin(math.pi * t)
         
-        return pygame.sndarray.make_sound(np.array(waves * 32767, dtype=np.int16))
+        return _make_sound(_to_pcm(waves))
     
     def generate_boss_spawn_sound(self, duration):
         """Generate boss spawn sound"""
-        sample_rate = 22050
-        samples = int(sample_rate * duration)
-        
-        import numpy as np
-        waves = np.zeros((samples, 1))  # 2D array for mono
-        
-        for i in range(samples):
-            t = float(i) / sample_rate
-            # Deep, menacing sound
-            freq = 60 + math.sin(t * 2) * 20
-            envelope = math.sin(math.pi * t)
-            waves[i, 0] = envelope * (
-                math.sin(2 * math.pi * freq * t) +
-                0.4 * random.uniform(-1, 1)
-            )
+        t = _time_axis(duration)
+        
+        # Deep, menacing sound
+        freq = 60 + np.sin(t * 2) * 20
+        envelope = np.sin(math.pi * t)
+        waves = envelope * (
+            np.sin(2 * math.pi * freq * t) +
+            0.4 * _noise(t)
+        )
         
-        return pygame.sndarray.make_sound(np.array(waves * 32767, dtype=np.int16))
+        return _make_sound(_to_pcm(waves))
     
     def generate_mega_victory_sound(self, duration):
         """Generate mega victory sound"""
-        sample_rate = 22050
-        samples = int(sample_rate * duration)
-        
-        import numpy as np
-        waves = np.zeros((samples, 1))  # 2D array for mono
-        
-        for i in range(samples):
-            t = float(i) / sample_rate
-            # Epic victory fanfare
-            base_freq = 200
-            freq = base_freq * (1 + (i / samples) * 2)
-            envelope = math.sin(math.pi * t)
-            waves[i, 0] = envelope * (
-                math.sin(2 * math.pi * freq * t) +
-                0.5 * math.sin(2 * math.pi * freq * 1.5 * t) +
-                0.3 * math.sin(2 * math.pi * freq * 2 * t)
-            )
-        
-        return pygame.sndarray.make_sound(np.array(waves * 32767, dtype=np.int16))
+        t = _time_axis(duration)
+        
+        # Epic victory fanfare
+        base_freq = 200
+        freq = base_freq * (1 + _progress(t) * 2)
+        waves = _harmonics(2 * math.pi * freq * t, ((1, 1.0), (1.5, 0.5), (2, 0.3)))
+        waves *= np.sin(math.pi * t)
+        
+        return _make_sound(_to_pcm(waves))
     
     def generate_critical_sound(self, duration):
         """Generate critical hit sound"""
-        sample_rate = 22050
-        samples = int(sample_rate * duration)
-        
-        import numpy as np
-        waves = np.zeros((samples, 1))  # 2D array for mono
+        t = _time_axis(duration)
         
-        for i in range(samples):
-            t = float(i) / sample_rate
-            # Sharp, high-pitched impact
-            freq = 1000 + (i / samples) * 500
-            envelope = math.exp(-t * 20)
-            waves[i, 0] = envelope * math.sin(2 * math.pi * freq * t)
+        # Sharp, high-pitched impact
+        freq = 1000 + _progress(t) * 500
+        envelope = np.exp(-20 * t)
+        waves = envelope * np.sin(2 * math.pi * freq * t)
         
-        return pygame.sndarray.make_sound(np.array(waves * 32767, dtype=np.int16))
+        return _make_sound(_to_pcm(waves))
     
     def generate_area_damage_sound(self, duration):
         """Generate area damage sound"""
-        sample_rate = 22050
-        samples = int(sample_rate * duration)
-        
-        import numpy as np
-        waves = np.zeros((samples, 1))  # 2D array for mono
-        
-        for i in range(samples):
-            t = float(i) / sample_rate
-            # Whoosh + impact
-            freq = 100 * (1 + t * 3)
-            envelope = math.sin(math.pi * t) * math.exp(-t * 2)
-            waves[i, 0] = envelope * (
-                0.6 * math.sin(2 * math.pi * freq * t) +
-                0.4 * random.uniform(-1, 1)
-            )
+        t = _time_axis(duration)
+        
+        # Whoosh + impact
+        freq = 100 * (1 + t * 3)
+        envelope = np.sin(math.pi * t) * np.exp(-2 * t)
+        waves = envelope * (
+            0.6 * np.sin(2 * math.pi * freq * t) +
+            0.4 * _noise(t)
+        )
         
-        return pygame.sndarray.make_sound(np.array(waves * 32767, dtype=np.int16))
+        return _make_sound(_to_pcm(waves))
     
     def generate_voice_sound(self, frequency, duration, voice_type):
-        """Generate enemy voice sound"""
-        sample_rate = 22050
-        samples = int(sample_rate * duration)
-        
-        import numpy as np
-        waves = np.zeros((samples, 1))  # 2D array for mono
-        
-        for i in range(samples):
-            t = float(i) / sample_rate
-            
-            # Different voice characteristics
-            if voice_type == "growl":
-                freq = frequency * (1 + random.uniform(-0.2, 0.2))
-                envelope = math.exp(-t * 3)
-                waves[i, 0] = envelope * (
-                    0.7 * math.sin(2 * math.pi * freq * t) +
-                    0.3 * random.uniform(-1, 1)
-                )
-            elif voice_type == "hiss":
-                freq = frequency * (1 + t * 0.5)
-                envelope = math.exp(-t * 5)
-                waves[i, 0] = envelope * (
-                    0.5 * math.sin(2 * math.pi * freq * t) +
-                    0.5 * random.uniform(-1, 1)
-                )
-            elif voice_type == "squeal":
-                freq = frequency * (1 + t * 2)
-                envelope = math.exp(-t * 4)
-                waves[i, 0] = envelope * math.sin(2 * math.pi * freq * t)
-            elif voice_type == "rumble":
-                freq = frequency
-                envelope = math.sin(math.pi * t)
-                waves[i, 0] = envelope * (
-                    0.8 * math.sin(2 * math.pi * freq * t) +
-                    0.2 * random.uniform(-1, 1)
-                )
-            elif voice_type == "roar":
-                freq = frequency * (1 - t * 0.3)
-                envelope = math.sin(math.pi * t)
-                waves[i, 0] = envelope * (
-                    0.6 * math.sin(2 * math.pi * freq * t) +
-                    0.4 * random.uniform(-1, 1)
-                )
-            else:  # default
-                freq = frequency
-                envelope = math.exp(-t * 3)
-                waves[i, 0] = envelope * math.sin(2 * math.pi * freq * t)
-        
-        return pygame.sndarray.make_sound(np.array(waves * 32767, dtype=np.int16))
+        """Generate enemy voice sound, or reuse an identical one"""
+        # Different voice characteristics; voice types without a kernel of
+        # their own all sound the same, so their voices can coincide
+        kernel = VOICE_KERNELS.get(voice_type, _voice_default)
+        key = (frequency, duration, kernel)
+        if key in self._voice_cache:
+            return self._voice_cache[key]
+        
+        t = _time_axis(duration)
+        noise = _VOICE_NOISE[:t.size] if t.size <= _VOICE_NOISE.size else _noise(t)
+        waves = kernel(t, frequency, noise)
+        
+        voice = self._voice_cache[key] = _make_sound(_to_pcm(waves))
+        return voice
     
     def generate_music_track(self, style, tempo, intensity):
         """Generate a simple music track"""
         duration = 10.0  # 10 second loop
-        sample_rate = 22050
-        samples = int(sample_rate * duration)
-        
-        import numpy as np
-        waves = np.zeros((samples, 1))  # 2D array for mono
+        t = _time_axis(duration)
         
         # Generate simple melody based on style
         if style == "ambient":
@@ -489,70 +594,83 @@ class DynamicAudioManager:
         
         note_duration = duration / len(melody_freqs)
         
-        for i in range(samples):
-            t = float(i) / sample_rate
-            
-            # Find current note
-            note_index = int(t / note_duration) % len(melody_freqs)
-            note_t = (t % note_duration) / note_duration
-            
-            freq = melody_freqs[note_index]
-            
-            # Simple envelope
-            envelope = math.sin(math.pi * note_t) * 0.3
-            
-            # Add some harmony
-            waves[i, 0] = envelope * (
-                0.6 * math.sin(2 * math.pi * freq * t) +
-                0.3 * math.sin(2 * math.pi * freq * 1.5 * t) +
-                0.1 * math.sin(2 * math.pi * freq * 2 * t)
-            )
+        # Note being played and how far into it, at every sample
+        note_position = t / np.float32(note_duration)
+        note_index = note_position.astype(np.intp)
+        note_t = note_position - note_index
+        
+        # Integrate the per-sample frequency into one continuous phase, so
+        # the tone never jumps between notes. It is summed in float64 and
+        # wrapped to 4 pi, a whole number of cycles for every partial.
+        phase_step = np.array(melody_freqs, dtype=np.float64)[note_index % len(melody_freqs)]
+        phase_step *= 2 * math.pi / SAMPLE_RATE
+        phase = np.cumsum(phase_step)
+        phase -= phase_step
+        phase = np.mod(phase, 4 * math.pi).astype(np.float32)
         
-        return pygame.sndarray.make_sound(np.array(waves * 32767, dtype=np.int16))
+        # Add some harmony
+        waves = _harmonics(phase, ((1, 0.6), (1.5, 0.3), (2, 0.1)))
+        
+        # Simple envelope
+        waves *= np.sin(math.pi * note_t) * 0.3
+        
+        return _make_sound(_to_pcm(waves))
     
     def play_sound(self, event_type, volume=0.5):
         """Play a sound effect"""
-        if not self.sound_enabled or event_type not in self.sounds:
+        if not self.sound_enabled or not self.audio_ready:
+            return
+        sound = self.sounds[event_type.index]
+        if sound is None:
+            return
+        
+        now = pygame.time.get_ticks()
+        last_event, last_time = self.last_sfx
+        if event_type is last_event and now - last_time < self.sfx_repeat_interval:
             return
         
-        sound = self.sounds[event_type]
+        if callable(sound):
+            sound = self.sounds[event_type.index] = sound()
         sound.set_volume(volume)
         self.sfx_channel.play(sound)
+        self.last_sfx = (event_type, now)
     
     def play_enemy_voice(self, enemy_type, voice_event, volume=0.4):
         """Play enemy voice sound"""
-        if not self.sound_enabled:
+        if not self.sound_enabled or not self.audio_ready:
             return
         
         # Check cooldown
-        cooldown_key = f"{enemy_type.value}_{voice_event}"
+        cooldown_key = (enemy_type.index, voice_event)
         if cooldown_key in self.voice_cooldowns:
-            if self.voice_cooldowns[cooldown_key] > 0:
-                return
+            return
         
-        if enemy_type in self.enemy_voices and voice_event in self.enemy_voices[enemy_type]:
-            voice = self.enemy_voices[enemy_type][voice_event]
+        voices = self.enemy_voices[enemy_type.index]
+        if voice_event in voices:
+            voice = voices[voice_event]
+            if callable(voice):
+                voice = voices[voice_event] = voice()
             voice.set_volume(volume)
             self.voice_channel.play(voice)
             
             # Set cooldown
-            self.voice_cooldowns[cooldown_key] = self.voice_cooldown_time
+            expiry = self.voice_clock + self.voice_cooldown_time
+            self.voice_cooldowns[cooldown_key] = expiry
+            heapq.heappush(self._cooldown_heap, (expiry, cooldown_key))
     
     def update_voice_cooldowns(self, dt):
-        """Update voice cooldowns"""
-        keys_to_remove = []
-        for key, cooldown in self.voice_cooldowns.items():
-            new_cooldown = cooldown - dt
-            if new_cooldown <= 0:
-                keys_to_remove.append(key)
-            else:
-                self.voice_cooldowns[key] = new_cooldown
-        
-        for key in keys_to_remove:
+        """Update voice cooldowns, only touching the ones that run out"""
+        self.voice_clock += dt
+        heap = self._cooldown_heap
+        while heap and heap[0][0] <= self.voice_clock:
+            _, key = heapq.heappop(heap)
             del self.voice_cooldowns[key]
     
     def update_dynamic_music(self, dt):
         """Update dynamic music based on game state"""
+        if not self.audio_ready:
+            return
+        
         # Calculate target intensity based on game state
         enemy_count = len(self.game.enemies)
         player_hp_percentage = self.game.player.hp / self.game.player.max_hp
@@ -564,7 +682,7 @@ class DynamicAudioManager:
         elif self.game.game_state == "victory":
             self.target_intensity = 0.8
             target_state = "victory"
-        elif any(enemy.enemy_type.value in ["boss", "mega_boss"] for enemy in self.game.enemies):
+        elif self.game.enemies.boss_count > 0:
             self.target_intensity = 0.9
             target_state = "boss"
         elif enemy_count > 10:
@@ -594,7 +712,11 @@ class DynamicAudioManager:
     def update(self, dt):
         """Update audio system"""
         self.update_voice_cooldowns(dt)
-        self.update_dynamic_music(dt)
+        
+        self.music_update_timer += dt
+        if self.music_update_timer >= self.music_update_interval:
+            self.update_dynamic_music(self.music_update_timer)
+            self.music_update_timer = 0.0
     
     def toggle_sound(self):
         """Toggle sound effects"""
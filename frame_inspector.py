@@ -1,5 +1,6 @@
 import pygame
 import sys
+import numpy as np
 from spritesheet_animator import SpriteSheet
 
 class FrameInspector:
@@ -13,19 +14,27 @@ class FrameInspector:
         self.font = pygame.font.Font(None, 24)
         self.title_font = pygame.font.Font(None, 36)
         
+        # Only queue the events handled below, so mouse motion and text input
+        # don't wake up the event wait
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN, pygame.MOUSEWHEEL, pygame.WINDOWEXPOSED])
+        
         # Load spritesheet
         self.spritesheet = SpriteSheet(spritesheet_path, frame_width=80, frame_height=80, scale=1.5)
         self.all_frames = self.spritesheet.get_all_frames()
+        # Grid tiles are 80x80, so scale them once here and keep the
+        # full-size frames for the current frame preview
+        self.grid_frames = [pygame.transform.smoothscale(f, (80, 80)).convert_alpha() for f in self.all_frames]
         
         # Navigation
         self.current_frame = 0
         self.frames_per_row = 10
         self.show_grid = True
         self.scroll_y = 0
-        total_rows = (len(self.all_frames) + self.frames_per_row - 1) // self.frames_per_row
-        visible_rows = 6
-        self.max_scroll = max(0, (total_rows - visible_rows) * 100)
-        print(f"Total frames: {len(self.all_frames)}, Total rows: {total_rows}, Max scroll: {self.max_scroll}")
+        self.total_rows = (len(self.all_frames) + self.frames_per_row - 1) // self.frames_per_row
+        self.visible_rows = 6
+        self.max_scroll = max(0, (self.total_rows - self.visible_rows) * 100)
+        print(f"Total frames: {len(self.all_frames)}, Total rows: {self.total_rows}, Max scroll: {self.max_scroll}")
         
         # Animation markers
         self.markers = {
@@ -41,8 +50,25 @@ class FrameInspector:
             'death_end': 42
         }
         
+        # The grid is rendered once into two atlases, with and without the
+        # range outlines, and blitted as a single sub-rect. Only the outlined
+        # one is rebuilt when a marker changes
+        self.label_surfs = [self.font.render(str(i), True, (255, 255, 255)) for i in range(len(self.all_frames))]
+        self.build_atlas()
+        self.rebuild_frame_colors()
+        self.build_grid_atlas()
+        
+        # Title, controls and legend never change, so they are pre-rendered
+        # into one overlay, and the screen is only repainted when dirty
+        self.build_static_overlay()
+        self.dirty = True
+        
     def handle_events(self):
-        for event in pygame.event.get():
+        # Sleep until an event arrives or a frame's time has passed instead of
+        # polling, then take whatever else is queued
+        events = [pygame.event.wait(16)]
+        events.extend(pygame.event.get())
+        for event in events:
             if event.type == pygame.QUIT:
                 return False
             
@@ -50,6 +76,10 @@ class FrameInspector:
                 # Mouse wheel scrolling
                 scroll_amount = event.y * 50  # Adjust scroll speed
                 self.scroll_y = max(0, min(self.max_scroll, self.scroll_y - scroll_amount))
+                self.dirty = True
+            
+            elif event.type == pygame.WINDOWEXPOSED:
+                self.dirty = True
             
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
@@ -78,6 +108,7 @@ class FrameInspector:
                 # Toggle grid
                 elif event.key == pygame.K_g:
                     self.show_grid = not self.show_grid
+                    self.atlas = self.atlas_grid if self.show_grid else self.atlas_plain
                 
                 # Quick jump to animation starts
                 elif event.key == pygame.K_1:
@@ -93,22 +124,155 @@ class FrameInspector:
                 
                 # Mark animation boundaries
                 elif event.key == pygame.K_n:  # Mark normal start
-                    self.markers['normal_start'] = self.current_frame
+                    self.mark_start('normal')
                 elif event.key == pygame.K_d:  # Mark dash start
-                    self.markers['dash_start'] = self.current_frame
+                    self.mark_start('dash')
                 elif event.key == pygame.K_a:  # Mark attack start
-                    self.markers['attack_start'] = self.current_frame
+                    self.mark_start('attack')
                 elif event.key == pygame.K_h:  # Mark hurt start
-                    self.markers['hurt_start'] = self.current_frame
+                    self.mark_start('hurt')
                 elif event.key == pygame.K_e:  # Mark death start
-                    self.markers['death_start'] = self.current_frame
+                    self.mark_start('death')
                 
                 # Print current markers
                 elif event.key == pygame.K_p:
                     self.print_markers()
+                
+                # Every other key changes what is shown
+                if event.key != pygame.K_p:
+                    self.dirty = True
         
         return True
     
+    def mark_start(self, animation):
+        """Start an animation range at the current frame"""
+        self.markers[f'{animation}_start'] = self.current_frame
+        old_color_idx = self.frame_color_idx
+        self.rebuild_frame_colors()
+        # Only the tiles whose range changed need their outline redrawn
+        self.redraw_grid_tiles(np.flatnonzero(self.frame_color_idx != old_color_idx))
+    
+    def rebuild_frame_colors(self):
+        """Work out the outline color of every frame from the animation ranges"""
+        palette = np.array([
+            (100, 100, 100),
+            (0, 255, 0),  # Green for normal
+            (0, 255, 255),  # Cyan for dash
+            (255, 0, 0),  # Red for attack
+            (255, 255, 0),  # Yellow for hurt
+            (128, 0, 128)  # Purple for death
+        ], dtype=np.uint8)
+        color_idx = np.zeros(len(self.all_frames), dtype=np.uint8)
+        # Assigned last to first so earlier ranges win where they overlap
+        for i, name in [(5, 'death'), (4, 'hurt'), (3, 'attack'), (2, 'dash'), (1, 'normal')]:
+            color_idx[self.markers[f'{name}_start']:self.markers[f'{name}_end'] + 1] = i
+        self.frame_color_idx = color_idx
+        self.frame_color = palette[color_idx]
+    
+    def build_atlas(self):
+        """Render every frame and its number into one surface"""
+        # Outlines start 2px outside each frame and numbers hang just below
+        pad = 2
+        self.atlas_pad = pad
+        self.tile_height = 90 + pad
+        atlas_w = (self.frames_per_row - 1) * 100 + 82 + pad
+        atlas_h = max(self.total_rows - 1, 0) * 100 + self.tile_height
+        self.atlas_plain = pygame.Surface((atlas_w, atlas_h), pygame.SRCALPHA).convert_alpha()
+        
+        blit_list = []
+        label_surfs = self.label_surfs
+        frames_per_row = self.frames_per_row
+        for i, frame in enumerate(self.grid_frames):
+            row, col = divmod(i, frames_per_row)
+            x = pad + col * 100
+            y = pad + row * 100
+            blit_list.append((frame, (x, y)))
+            blit_list.append((label_surfs[i], (x + 35, y + 70)))
+        self.atlas_plain.blits(blit_list, doreturn=False)
+    
+    def build_grid_atlas(self):
+        """Render the plain atlas over the animation range outlines"""
+        self.atlas_grid = pygame.Surface(self.atlas_plain.get_size(), pygame.SRCALPHA).convert_alpha()
+        self.redraw_grid_tiles(range(len(self.grid_frames)))
+        self.atlas = self.atlas_grid if self.show_grid else self.atlas_plain
+    
+    def redraw_grid_tiles(self, frames):
+        """Redraw the outline and contents of some tiles of the outlined atlas"""
+        pad = self.atlas_pad
+        atlas = self.atlas_grid
+        draw_rect = pygame.draw.rect
+        frame_color = self.frame_color
+        frames_per_row = self.frames_per_row
+        blit_list = []
+        for i in frames:
+            row, col = divmod(int(i), frames_per_row)
+            tile = pygame.Rect(pad - 2 + col * 100, pad - 2 + row * 100, 84, self.tile_height)
+            atlas.fill((0, 0, 0, 0), tile)
+            draw_rect(atlas, tuple(frame_color[i]), (tile.x, tile.y, 84, 84), 1)
+            # Frame and number go on top of the outline
+            blit_list.append((self.atlas_plain, tile.topleft, tile))
+        atlas.blits(blit_list, doreturn=False)
+    
+    def build_static_overlay(self):
+        """Render the text and legend that never change into one surface"""
+        # Drawn on the background color, which is then keyed out; an RLE
+        # colorkey blit is far cheaper than a full-screen per-pixel alpha blit
+        overlay = pygame.Surface(self.screen.get_size())
+        overlay.fill((30, 30, 50))
+        
+        # Title
+        title = self.title_font.render("Frame Inspector - Find Your Animation Frames", True, (255, 255, 255))
+        overlay.blit(title, (overlay.get_width() // 2 - title.get_width() // 2, 20))
+        
+        if self.max_scroll > 0:
+            scroll_help = self.font.render("Use mouse wheel or Page Up/Down", True, (150, 150, 150))
+            overlay.blit(scroll_help, (1080 - 100, 80 + 600 + 10))
+        
+        # Controls, left blank where draw() puts the current frame and scroll
+        info_y = 650
+        info_texts = [
+            "",
+            f"Total Frames: {len(self.all_frames)}",
+            "",
+            "",
+            "CONTROLS:",
+            "Arrow Keys: Navigate frames",
+            "Page Up/Down: Scroll view",
+            "Home/End: Jump to top/bottom",
+            "1-5: Jump to animation starts",
+            "N/D/A/H/E: Mark animation starts",
+            "G: Toggle grid",
+            "P: Print configuration",
+            "ESC: Exit"
+        ]
+        
+        x_offset = 300
+        for i, text in enumerate(info_texts):
+            if text:
+                text_surface = self.font.render(text, True, (200, 200, 200))
+                overlay.blit(text_surface, (x_offset, info_y + i * 25))
+        
+        # Legend
+        legend_x = 800
+        legend_items = [
+            ("Normal", (0, 255, 0)),
+            ("Dash", (0, 255, 255)),
+            ("Attack", (255, 0, 0)),
+            ("Hurt", (255, 255, 0)),
+            ("Death", (128, 0, 128))
+        ]
+        
+        legend_text = self.font.render("ANIMATION COLORS:", True, (255, 255, 255))
+        overlay.blit(legend_text, (legend_x, info_y))
+        
+        for i, (name, color) in enumerate(legend_items):
+            pygame.draw.rect(overlay, color, (legend_x, info_y + 30 + i * 25, 20, 20))
+            text_surface = self.font.render(name, True, (200, 200, 200))
+            overlay.blit(text_surface, (legend_x + 30, info_y + 30 + i * 25))
+        
+        overlay.set_colorkey((30, 30, 50), pygame.RLEACCEL)
+        self.static_overlay = overlay
+    
     def print_markers(self):
         print("\n🎯 CURRENT ANIMATION MARKERS:")
         print(f"Normal: frames {self.markers['normal_start']}-{self.markers['normal_end']}")
@@ -128,50 +292,27 @@ class FrameInspector:
     def draw(self):
         self.screen.fill((30, 30, 50))
         
-        # Title
-        title = self.title_font.render("Frame Inspector - Find Your Animation Frames", True, (255, 255, 255))
-        self.screen.blit(title, (self.screen.get_width() // 2 - title.get_width() // 2, 20))
-        
         # Draw frame grid
         start_y = 80
-        visible_rows = 6  # Show 6 rows at a time
         
-        for i, frame in enumerate(self.all_frames):
-            row = i // self.frames_per_row
-            col = i % self.frames_per_row
-            x = 50 + col * 100
-            y = start_y + row * 100 - self.scroll_y
-            
-            # Skip frames that are outside visible area
-            if y < start_y - 100 or y > start_y + visible_rows * 100:
-                continue
-            
-            # Highlight current frame
-            if i == self.current_frame:
-                pygame.draw.rect(self.screen, (255, 255, 0), (x - 5, y - 5, 90, 90), 3)
-            
-            # Highlight animation ranges
-            color = (100, 100, 100)
-            if self.markers['normal_start'] <= i <= self.markers['normal_end']:
-                color = (0, 255, 0)  # Green for normal
-            elif self.markers['dash_start'] <= i <= self.markers['dash_end']:
-                color = (0, 255, 255)  # Cyan for dash
-            elif self.markers['attack_start'] <= i <= self.markers['attack_end']:
-                color = (255, 0, 0)  # Red for attack
-            elif self.markers['hurt_start'] <= i <= self.markers['hurt_end']:
-                color = (255, 255, 0)  # Yellow for hurt
-            elif self.markers['death_start'] <= i <= self.markers['death_end']:
-                color = (128, 0, 128)  # Purple for death
-            
-            if self.show_grid or i == self.current_frame:
-                pygame.draw.rect(self.screen, color, (x - 2, y - 2, 84, 84), 1)
-            
-            # Draw frame
-            self.screen.blit(frame, (x, y))
-            
-            # Frame number
-            frame_text = self.font.render(str(i), True, (255, 255, 255))
-            self.screen.blit(frame_text, (x + 35, y + 70))
+        # Rows starting within a row of the visible area, as one atlas sub-rect
+        first_row = max(0, (self.scroll_y - 1) // 100)
+        last_row = min(self.total_rows - 1, (self.scroll_y + self.visible_rows * 100) // 100)
+        if last_row >= first_row:
+            pad = self.atlas_pad
+            area = pygame.Rect(0, first_row * 100, self.atlas.get_width(),
+                               (last_row - first_row) * 100 + self.tile_height)
+            self.screen.blit(self.atlas, (50 - pad, start_y + first_row * 100 - self.scroll_y - pad), area)
+        
+        # Highlight current frame
+        row = self.current_frame // self.frames_per_row
+        col = self.current_frame % self.frames_per_row
+        x = 50 + col * 100
+        y = start_y + row * 100 - self.scroll_y
+        if first_row <= row <= last_row:
+            pygame.draw.rect(self.screen, (255, 255, 0), (x - 5, y - 5, 90, 90), 3)
+            if not self.show_grid:
+                pygame.draw.rect(self.screen, tuple(self.frame_color[self.current_frame]), (x - 2, y - 2, 84, 84), 1)
         
         # Scroll indicator and scrollbar
         if self.max_scroll > 0:
@@ -193,62 +334,32 @@ class FrameInspector:
                 thumb_height = max(20, scrollbar_height * (scrollbar_height / (scrollbar_height + self.max_scroll)))
                 thumb_y = scrollbar_y + (self.scroll_y / self.max_scroll) * (scrollbar_height - thumb_height)
                 pygame.draw.rect(self.screen, (150, 150, 150), (scrollbar_x, thumb_y, scrollbar_width, thumb_height))
-            
-            # Labels
-            scroll_help = self.font.render("Use mouse wheel or Page Up/Down", True, (150, 150, 150))
-            self.screen.blit(scroll_help, (scrollbar_x - 100, scrollbar_y + scrollbar_height + 10))
         
         # Current frame info
         info_y = 650
         current_frame = self.all_frames[self.current_frame]
         self.screen.blit(current_frame, (50, info_y))
         
-        info_texts = [
-            f"Current Frame: {self.current_frame}",
-            f"Total Frames: {len(self.all_frames)}",
-            f"Scroll: {self.scroll_y // 100} rows down",
-            "",
-            "CONTROLS:",
-            "Arrow Keys: Navigate frames",
-            "Page Up/Down: Scroll view",
-            "Home/End: Jump to top/bottom",
-            "1-5: Jump to animation starts",
-            "N/D/A/H/E: Mark animation starts",
-            "G: Toggle grid",
-            "P: Print configuration",
-            "ESC: Exit"
-        ]
+        self.screen.blit(self.static_overlay, (0, 0))
         
         x_offset = 300
-        for i, text in enumerate(info_texts):
+        info_texts = [
+            (0, f"Current Frame: {self.current_frame}"),
+            (2, f"Scroll: {self.scroll_y // 100} rows down")
+        ]
+        for i, text in info_texts:
             text_surface = self.font.render(text, True, (200, 200, 200))
             self.screen.blit(text_surface, (x_offset, info_y + i * 25))
         
-        # Legend
-        legend_x = 800
-        legend_items = [
-            ("Normal", (0, 255, 0)),
-            ("Dash", (0, 255, 255)),
-            ("Attack", (255, 0, 0)),
-            ("Hurt", (255, 255, 0)),
-            ("Death", (128, 0, 128))
-        ]
-        
-        legend_text = self.font.render("ANIMATION COLORS:", True, (255, 255, 255))
-        self.screen.blit(legend_text, (legend_x, info_y))
-        
-        for i, (name, color) in enumerate(legend_items):
-            pygame.draw.rect(self.screen, color, (legend_x, info_y + 30 + i * 25, 20, 20))
-            text_surface = self.font.render(name, True, (200, 200, 200))
-            self.screen.blit(text_surface, (legend_x + 30, info_y + 30 + i * 25))
-        
         pygame.display.flip()
     
     def run(self):
         running = True
         while running:
             running = self.handle_events()
-            self.draw()
+            if self.dirty:
+                self.draw()
+                self.dirty = False
             self.clock.tick(60)
         
         pygame.quit()
@@ -2,7 +2,7 @@ import pygame
 import random
 import math
 from player import Player
-from enemy import Enemy, EnemyType
+from enemy import Enemy, EnemyType, EnemyPool, EFFECT_QUEUE, EFFECT_NAMES
 from projectile import Projectile, ProjectileType
 from powerups import PowerUpManager
 from upgrades import UpgradeManager
@@ -17,6 +17,7 @@ from music import play_music, toggle_music, init_music
 from visual_feedback import VisualFeedbackManager
 from enhanced_audio import DynamicAudioManager, AudioEventType, EnemyVoiceType
 from asset_loader import asset_loader
+from collsion import spatial_groupcollide
 
 class ProgressionManager:
     """Manages progressive unlocking of enemies and abilities based on player level"""
@@ -158,7 +159,7 @@ class Game:
         # Game entities
         self.player = Player((self.screen_width // 2, self.screen_height // 2))
         self.player.game = self  # Set game reference for stats tracking
-        self.enemies = pygame.sprite.Group()
+        self.enemies = EnemyPool()
         self.projectiles = pygame.sprite.Group()
         self.xp_orbs = pygame.sprite.Group()
         self.power_ups = pygame.sprite.Group()
@@ -221,8 +222,8 @@ class Game:
         # Win condition (survive 10 minutes)
         self.survival_time = 600  # seconds
         
-        # Load assets
-        asset_loader.load_images()
+        # Load assets, pre-scaled to the mega boss sprite size
+        asset_loader.load_images(target_sizes=[(60, 60)])
         
         # Initialize sound system
         self.sound_enabled = init_sounds()
@@ -319,8 +320,9 @@ class Game:
         mouse_pos = pygame.mouse.get_pos()
         self.player.manual_shoot(dt, self.projectiles, mouse_pos)
         
-        # Update entities
-        self.enemies.update(dt, self.player.pos)
+        # Update entities; enemies share one tick reading for the whole frame
+        now = pygame.time.get_ticks()
+        self.enemies.update(dt, self.player.pos, now)
         self.projectiles.update(dt, self.enemies)  # Pass enemies for homing projectiles
         self.xp_orbs.update(dt, self.player.pos, self.player.pickup_range)
         self.power_up_manager.update(dt)
@@ -421,22 +423,22 @@ class Game:
         if enemy.enemy_type == EnemyType.TANK and self.progression_manager.has_ability("basic_shield"):
             if "shield" not in enemy.abilities:
                 enemy.abilities.append("shield")
-                enemy.ability_cooldowns["shield"] = 8.0
+                enemy.set_cooldowns(shield=8.0)
         
         if enemy.enemy_type == EnemyType.FAST and self.progression_manager.has_ability("fast_dash"):
             if "dash" not in enemy.abilities:
                 enemy.abilities.append("dash")
-                enemy.ability_cooldowns["dash"] = 4.0
+                enemy.set_cooldowns(dash=4.0)
         
         if enemy.enemy_type == EnemyType.BOSS and self.progression_manager.has_ability("boss_summon"):
             if "summon" not in enemy.abilities:
                 enemy.abilities.append("summon")
-                enemy.ability_cooldowns["summon"] = 12.0
+                enemy.set_cooldowns(summon=12.0)
         
         if enemy.enemy_type == EnemyType.TANK and self.progression_manager.has_ability("tank_stomp"):
             if "stomp" not in enemy.abilities:
                 enemy.abilities.append("stomp")
-                enemy.ability_cooldowns["stomp"] = 6.0
+                enemy.set_cooldowns(stomp=6.0)
         
         # Enhanced abilities at high level
         if self.progression_manager.has_ability("elite_enhanced"):
@@ -497,22 +499,20 @@ class Game:
         
         # Find entities in explosion radius
         # Damage enemies
-        for enemy in self.enemies:
-            if enemy != bomber:  # Don't damage self
-                distance = (enemy.pos - explosion_pos).length()
-                if distance <= explosion_radius:
-                    damage_falloff = 1.0 - (distance / explosion_radius)
-                    area_damage = bomber.damage * damage_falloff
-                    enemy.hp -= area_damage
-                    
-                    # Create impact effect
-                    self.particle_system.create_impact(enemy.rect.center, (255, 100, 0), 5)
-                    
-                    # Check if enemy died from bomber explosion
-                    if enemy.hp <= 0:
-                        self.particle_system.create_death_effect(enemy.rect.center, enemy.color, 10)
-                        self.xp_orbs.add(XPOrb(enemy.rect.center, enemy.xp_value))
-                        enemy.kill()
+        for enemy, distance in self.enemies.within(explosion_pos, explosion_radius):
+            if enemy is not bomber:  # Don't damage self
+                damage_falloff = 1.0 - (distance / explosion_radius)
+                area_damage = bomber.damage * damage_falloff
+                enemy.hp -= area_damage
+                
+                # Create impact effect
+                self.particle_system.create_impact(enemy.rect.center, (255, 100, 0), 5)
+                
+                # Check if enemy died from bomber explosion
+                if enemy.hp <= 0:
+                    self.particle_system.create_death_effect(enemy.rect.center, enemy.color, 10)
+                    self.xp_orbs.add(XPOrb(enemy.rect.center, enemy.xp_value))
+                    enemy.kill()
         
         # Damage player if in range
         player_distance = (self.player.pos - explosion_pos).length()
@@ -536,26 +536,24 @@ class Game:
         self.particle_system.create_explosion(explosion_pos, (255, 100, 0), 20)
         
         # Find enemies in explosion radius
-        for enemy in self.enemies:
-            distance = (enemy.pos - explosion_pos).length()
-            if distance <= explosion_radius:
-                # Calculate damage based on distance (closer = more damage)
-                damage_falloff = 1.0 - (distance / explosion_radius)
-                area_damage = explosion_damage * damage_falloff
-                
-                enemy.hp -= area_damage
-                
-                # Create impact effect for area damage
-                self.particle_system.create_impact(enemy.rect.center, (255, 150, 0), 3)
-                
-                # Add floating damage for area damage
-                if area_damage > 1:
-                    self.floating_text.add_damage_number(enemy.rect.center, int(area_damage))
-                
-                # Check if enemy died from area damage
-                if enemy.hp <= 0:
-                    # Create death effect
-                    self.particle_system.create_death_effect(enemy.rect.center, enemy.color, 10)
+        for enemy, distance in self.enemies.within(explosion_pos, explosion_radius):
+            # Calculate damage based on distance (closer = more damage)
+            damage_falloff = 1.0 - (distance / explosion_radius)
+            area_damage = explosion_damage * damage_falloff
+            
+            enemy.hp -= area_damage
+            
+            # Create impact effect for area damage
+            self.particle_system.create_impact(enemy.rect.center, (255, 150, 0), 3)
+            
+            # Add floating damage for area damage
+            if area_damage > 1:
+                self.floating_text.add_damage_number(enemy.rect.center, int(area_damage))
+            
+            # Check if enemy died from area damage
+            if enemy.hp <= 0:
+                # Create death effect
+                self.particle_system.create_death_effect(enemy.rect.center, enemy.color, 10)
     def get_random_edge_position(self):
         screen_width, screen_height = 1280, 720
         edge = random.choice(['top', 'bottom', 'left', 'right'])
@@ -571,7 +569,7 @@ class Game:
     
     def handle_collisions(self):
         # Projectile -> Enemy collisions
-        hits = pygame.sprite.groupcollide(self.enemies, self.projectiles, False, False)
+        hits = spatial_groupcollide(self.enemies, self.projectiles, False, False)
         explosions_to_process = []
         
         for enemy, projectiles in hits.items():
@@ -740,99 +738,70 @@ class Game:
             orb.kill()
     
     def process_enemy_special_effects(self):
-        """Process special effects from enemies"""
-        current_time = pygame.time.get_ticks()
-        
-        for enemy in self.enemies:
-            if hasattr(enemy, 'special_effects'):
-                effects_to_remove = []
+        """Process special effects queued by enemies this frame"""
+        for enemy, (effect, _, x, y, x2, y2, aux) in EFFECT_QUEUE.drain():
+            if not enemy.alive():
+                continue
+            effect_type = EFFECT_NAMES[effect]
+            
+            # Process different effect types
+            if effect_type == "heal":
+                # Heal nearby enemies
+                self.heal_nearby_enemies(enemy, enemy.heal_amount, enemy.heal_range)
                 
-                for effect in enemy.special_effects:
-                    effect_type = effect[0]
-                    effect_time = effect[1]
-                    
-                    # Process different effect types
-                    if effect_type == "heal":
-                        # Heal nearby enemies
-                        self.heal_nearby_enemies(enemy, enemy.heal_amount, enemy.heal_range)
-                        effects_to_remove.append(effect)
-                        
-                    elif effect_type == "explosion":
-                        # Handle bomber explosion
-                        if len(effect) >= 4:
-                            pos, radius = effect[2], effect[3]
-                            self.handle_explosion(pos, radius, enemy.damage)
-                        effects_to_remove.append(effect)
-                        
-                    elif effect_type == "shoot":
-                        # Enemy shoots projectile
-                        if len(effect) >= 3:
-                            target_pos = effect[2]
-                            self.enemy_shoot_projectile(enemy, target_pos)
-                        effects_to_remove.append(effect)
-                        
-                    elif effect_type == "laser_charge":
-                        # Visual charging effect
-                        self.create_laser_charge_effect(enemy)
-                        
-                    elif effect_type == "laser_fire":
-                        # Fire laser beam
-                        if len(effect) >= 3:
-                            target_pos = effect[2]
-                            self.fire_enemy_laser(enemy, target_pos)
-                        effects_to_remove.append(effect)
-                        
-                    elif effect_type == "mortar_fire":
-                        # Fire mortar projectile
-                        if len(effect) >= 3:
-                            target_pos = effect[2]
-                            self.fire_mortar_projectile(enemy, target_pos)
-                        effects_to_remove.append(effect)
-                        
-                    elif effect_type == "summon":
-                        # Summon new enemies
-                        self.summon_enemy(enemy)
-                        effects_to_remove.append(effect)
-                        
-                    elif effect_type == "stealth":
-                        # Enter stealth visual
-                        enemy.color = (50, 50, 50)  # Dark color for stealth
-                        
-                    elif effect_type == "backstab":
-                        # Exit stealth with bonus damage
-                        enemy.color = (100, 100, 100)  # Normal color
-                        enemy.collision_damage *= enemy.backstab_multiplier
-                        
-                    elif effect_type == "dash_charge":
-                        # Visual charging effect for mega boss dash
-                        self.create_dash_charge_effect(enemy)
-                        
-                    elif effect_type == "dash_execute":
-                        # Visual effect for dash execution
-                        if len(effect) >= 4:
-                            old_pos, new_pos = effect[2], effect[3]
-                            self.create_dash_effect(old_pos, new_pos)
-                        effects_to_remove.append(effect)
+            elif effect_type == "explosion":
+                # Handle bomber explosion
+                self.handle_explosion(enemy, pygame.Vector2(x, y), aux, enemy.damage)
+                
+            elif effect_type == "shoot":
+                # Enemy shoots projectile
+                self.enemy_shoot_projectile(enemy, pygame.Vector2(x, y))
+                
+            elif effect_type == "laser_charge":
+                # Visual charging effect
+                self.create_laser_charge_effect(enemy)
+                
+            elif effect_type == "laser_fire":
+                # Fire laser beam
+                self.fire_enemy_laser(enemy, pygame.Vector2(x, y))
+                
+            elif effect_type == "mortar_fire":
+                # Fire mortar projectile
+                self.fire_mortar_projectile(enemy, pygame.Vector2(x, y))
+                
+            elif effect_type == "summon":
+                # Summon new enemies
+                self.summon_enemy(enemy)
+                
+            elif effect_type == "stealth":
+                # Enter stealth visual
+                enemy.color = (50, 50, 50)  # Dark color for stealth
+                
+            elif effect_type == "backstab":
+                # Exit stealth with bonus damage
+                enemy.color = (100, 100, 100)  # Normal color
+                enemy.collision_damage *= enemy.backstab_multiplier
+                
+            elif effect_type == "dash_charge":
+                # Visual charging effect for mega boss dash
+                self.create_dash_charge_effect(enemy)
                 
-                # Remove processed effects
-                for effect in effects_to_remove:
-                    if effect in enemy.special_effects:
-                        enemy.special_effects.remove(effect)
+            elif effect_type == "dash_execute":
+                # Visual effect for dash execution
+                self.create_dash_effect(pygame.Vector2(x, y), pygame.Vector2(x2, y2))
     
     def heal_nearby_enemies(self, healer, heal_amount, heal_range):
         """Heal all enemies within range of the healer"""
-        for enemy in self.enemies:
-            if enemy != healer:
-                distance = (enemy.pos - healer.pos).length()
-                if distance <= heal_range:
-                    # Heal the enemy
-                    enemy.hp = min(enemy.hp + heal_amount, enemy.max_hp)
-                    # Create visual effect
-                    self.particle_system.create_heal_effect(enemy.rect.center)
-                    # Show floating text
-                    self.floating_text.add_text(enemy.rect.center, f"+{heal_amount}", (0, 255, 0))
+        for enemy, _ in self.enemies.within(healer.get_position(), heal_range):
+            if enemy is not healer:
+                # Heal the enemy
+                enemy.hp = min(enemy.hp + heal_amount, enemy.max_hp)
+                # Create visual effect
+                self.particle_system.create_heal_effect(enemy.rect.center)
+                # Show floating text
+                self.floating_text.add_text(enemy.rect.center, f"+{heal_amount}", (0, 255, 0))
     
-    def handle_explosion(self, pos, radius, damage):
+    def handle_explosion(self, source, pos, radius, damage):
         """Handle explosion damage and effects"""
         # Create visual explosion
         self.particle_system.create_explosion(pos, (255, 100, 0), 30)
@@ -844,11 +813,9 @@ class Game:
             self.player.take_damage(damage)
         
         # Damage other enemies
-        for enemy in self.enemies:
-            if enemy.pos != pos:  # Don't damage the exploding enemy
-                distance = (enemy.pos - pos).length()
-                if distance <= radius:
-                    enemy.take_damage(damage // 2)  # Less damage to other enemies
+        for enemy, _ in self.enemies.within(pos, radius):
+            if enemy is not source:  # Don't damage the exploding enemy
+                enemy.take_damage(damage // 2)  # Less damage to other enemies
     
     def enemy_shoot_projectile(self, enemy, target_pos):
         """Enemy shoots a projectile toward player"""
@@ -967,8 +934,7 @@ class Game:
             shake_offset = self.screen_shake.get_offset()
             
             # Draw game entities with shake offset
-            for enemy in self.enemies:
-                self.screen.blit(enemy.image, (enemy.rect.x + int(shake_offset.x), enemy.rect.y + int(shake_offset.y)))
+            self.enemies.draw(self.screen, shake_offset)
             
             for projectile in self.projectiles:
                 self.screen.blit(projectile.image, (projectile.rect.x + int(shake_offset.x), projectile.rect.y + int(shake_offset.y)))
@@ -4,6 +4,11 @@ from game import Game
 from main_menu import MainMenu
 
 def main():
+    # Configure the mixer before pygame.init() opens it with its own defaults,
+    # which would make the later mixer.init() calls no-ops. All sounds are
+    # generated at 22050 Hz; a 2048 sample buffer keeps the mixer from
+    # underrunning when many effects are queued.
+    pygame.mixer.pre_init(frequency=22050, size=-16, channels=2, buffer=2048)
     pygame.init()
     
     # Create a dummy game object to pass fullscreen state
@@ -47,7 +47,6 @@ class Button:
             self.particles[i] = (x + vx * dt, y + vy * dt, life, vx * 0.95, vy * 0.95 + 50 * dt)
     
     def add_hover_particles(self):
-        import random
         for _ in range(10):
             x = self.rect.centerx + random.uniform(-self.rect.width//2, self.rect.width//2)
             y = self.rect.centery + random.uniform(-self.rect.height//2, self.rect.height//2)
@@ -120,7 +119,7 @@ class MainMenu:
             self.screen = pygame.display.set_mode((self.screen_width, self.screen_height))
         
         # Audio system
-        pygame.mixer.init(frequency=22050, size=-16, channels=2, buffer=512)
+        pygame.mixer.init(frequency=22050, size=-16, channels=2, buffer=2048)
         self.sound_enabled = True
         self.menu_sounds = self.create_menu_sounds()
         
@@ -167,7 +166,6 @@ class MainMenu:
         self.menu_animation = 0
         
     def init_background_particles(self):
-        import random
         for _ in range(50):
             x = random.uniform(0, self.screen_width)
             y = random.uniform(0, self.screen_height)
@@ -1,7 +1,7 @@
 import pygame
 import sys
 import math
-from enemy import Enemy, EnemyType
+from enemy import Enemy, EnemyType, STATE_IDS, STATE_NORMAL
 from asset_loader import asset_loader
 from spritesheet_animator import MegaBossAnimator
 
@@ -121,7 +121,7 @@ class MegaBossTest:
                 self.current_state = self.available_states[(current_index + 1) % len(self.available_states)]
         
         # Update mega boss state
-        self.mega_boss.current_state = self.current_state
+        self.mega_boss.current_state = STATE_IDS.get(self.current_state, STATE_NORMAL)
         
         # Use spritesheet animator if available
         if self.use_spritesheet and self.spritesheet_animator:
@@ -133,9 +133,10 @@ class MegaBossTest:
                 self.mega_boss.rect = self.mega_boss.image.get_rect(center=self.mega_boss.pos)
         else:
             # Fallback to static images
-            if hasattr(self.mega_boss, 'custom_images') and self.current_state in self.mega_boss.custom_images:
-                custom_image = self.mega_boss.custom_images[self.current_state]
-                self.mega_boss.image = pygame.transform.scale(custom_image, (self.mega_boss.size, self.mega_boss.size))
+            state = STATE_IDS.get(self.current_state)
+            if state is not None and self.mega_boss.custom_images[state] is not None:
+                # Custom images are already scaled to the boss size
+                self.mega_boss.image = self.mega_boss.custom_images[state]
         
         # Update movement
         if self.target_pos:
@@ -242,11 +243,11 @@ class MegaBossTest:
             f"Spritesheet: {'✓' if self.use_spritesheet else '✗'}",
             "",
             "STATIC IMAGES:",
-            f"Normal: {'✓' if 'mega_boss_normal' in self.mega_boss.custom_images else '✗'}",
-            f"Dash: {'✓' if 'mega_boss_dash' in self.mega_boss.custom_images else '✗'}",
-            f"Attack: {'✓' if 'mega_boss_attack' in self.mega_boss.custom_images else '✗'}",
-            f"Hurt: {'✓' if 'mega_boss_hurt' in self.mega_boss.custom_images else '✗'}",
-            f"Death: {'✓' if 'mega_boss_death' in self.mega_boss.custom_images else '✗'}",
+            f"Normal: {'✓' if self.mega_boss.custom_images[STATE_IDS['normal']] is not None else '✗'}",
+            f"Dash: {'✓' if self.mega_boss.custom_images[STATE_IDS['dash']] is not None else '✗'}",
+            f"Attack: {'✓' if self.mega_boss.custom_images[STATE_IDS['attack']] is not None else '✗'}",
+            f"Hurt: {'✓' if self.mega_boss.custom_images[STATE_IDS['hurt']] is not None else '✗'}",
+            f"Death: {'✓' if self.mega_boss.custom_images[STATE_IDS['death']] is not None else '✗'}",
         ]
         
         y_offset = 200
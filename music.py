@@ -5,7 +5,7 @@ import math
 class MusicManager:
     """Manages generated background music for the game"""
     def __init__(self):
-        pygame.mixer.init(frequency=22050, size=-16, channels=2, buffer=1024)
+        pygame.mixer.init(frequency=22050, size=-16, channels=2, buffer=2048)
         self.current_music = None
         self.volume = 0.3
         self.enabled = True
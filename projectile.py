@@ -186,14 +186,7 @@ class Projectile(pygame.sprite.Sprite):
         # Special behaviors based on type
         if self.projectile_type == ProjectileType.HOMING and enemies:
             # Home towards nearest enemy
-            nearest_enemy = None
-            min_distance = float('inf')
-            
-            for enemy in enemies:
-                distance = (enemy.pos - self.pos).length()
-                if distance < min_distance:
-                    min_distance = distance
-                    nearest_enemy = enemy
+            nearest_enemy, min_distance = enemies.nearest(self.pos)
             
             if nearest_enemy and min_distance < 400:  # Home within 400 pixels
                 direction_to_enemy = (nearest_enemy.pos - self.pos).normalize()
@@ -219,14 +212,7 @@ class Projectile(pygame.sprite.Sprite):
             # Combine behaviors from hybrid types
             if ProjectileType.HOMING in self.hybrid_types and enemies:
                 # Homing behavior
-                nearest_enemy = None
-                min_distance = float('inf')
-                
-                for enemy in enemies:
-                    distance = (enemy.pos - self.pos).length()
-                    if distance < min_distance:
-                        min_distance = distance
-                        nearest_enemy = enemy
+                nearest_enemy, min_distance = enemies.nearest(self.pos)
                 
                 if nearest_enemy and min_distance < 350:
                     direction_to_enemy = (nearest_enemy.pos - self.pos).normalize()
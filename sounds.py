@@ -5,7 +5,7 @@ import math
 class SoundManager:
     """Manages generated sound effects for the game"""
     def __init__(self):
-        pygame.mixer.init(frequency=22050, size=-16, channels=2, buffer=512)
+        pygame.mixer.init(frequency=22050, size=-16, channels=2, buffer=2048)
         self.sounds = {}
         self.enabled = True
         self.volume = 0.5
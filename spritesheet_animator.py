@@ -55,7 +55,8 @@ class SpriteSheet:
                     new_height = int(self.frame_height * self.scale)
                     frame = pygame.transform.scale(frame, (new_width, new_height))
                 
-                frames.append(frame)
+                # Match the display's pixel format so blits skip conversion
+                frames.append(frame.convert_alpha())
         
         return frames
     